@@ -48,7 +48,7 @@ class FavoriteAdmin(admin.ModelAdmin):
     list_filter = ('added_at',) # Add a filter for the added_at field.
 
 from django.contrib import admin
-from .models import BlogPost, Category, Comment, Like
+from .models import BlogPost, Category, Comment, Like, Tag
 
 class BlogPostAdmin(admin.ModelAdmin):
     list_display = ('title', 'author', 'category', 'is_published', 'created_at')
@@ -59,6 +59,10 @@ class CommentAdmin(admin.ModelAdmin):
     list_display = ('post', 'user', 'created_at')
     search_fields = ('post__title', 'user__username')
 
+class TagAdmin(admin.ModelAdmin):
+    list_display = ('name',)
+    search_fields = ('name',)
+
 class LikeAdmin(admin.ModelAdmin):
     list_display = ('post', 'user', 'created_at')
 
@@ -66,3 +70,4 @@ admin.site.register(BlogPost, BlogPostAdmin)
 admin.site.register(Category)
 admin.site.register(Comment, CommentAdmin)
 admin.site.register(Like, LikeAdmin)
+admin.site.register(Tag, TagAdmin)
@@ -0,0 +1,184 @@
+"""
+Async variants of the password-handling views, served when the app runs
+under ASGI (see soloquest_backend/asgi.py).  Password hashing runs in the
+accounts.hashing process pool, so a login burst no longer blocks the
+process serving every other endpoint.
+"""
+import json
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponseNotAllowed, JsonResponse
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from . import hashing
+from .authentication import get_user_from_token
+from .models import CustomUser
+from .ratelimit import address_ident, rate_limiter
+
+
+def _async_post_view(view):
+    # Django 4.2's csrf_exempt/require_POST only wrap sync views
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        if request.method != 'POST':
+            return HttpResponseNotAllowed(['POST'])
+        return await view(request, *args, **kwargs)
+
+    wrapper.csrf_exempt = True
+    return wrapper
+
+
+def _request_data(request):
+    if request.content_type == 'application/json':
+        try:
+            return json.loads(request.body or b'{}')
+        except ValueError:
+            return {}
+    return request.POST
+
+
+def _busy():
+    response = JsonResponse({'error': 'Server busy, please retry.'}, status=503)
+    response['Retry-After'] = '1'
+    return response
+
+
+def _throttled(wait):
+    response = JsonResponse({'detail': f'Request was throttled. Expected available in {wait} seconds.'}, status=429)
+    response['Retry-After'] = str(wait)
+    return response
+
+
+async def _check_rate(scope, request):
+    wait = await sync_to_async(rate_limiter.check)(scope, address_ident(request))
+    return _throttled(wait) if wait is not None else None
+
+
+def _tokens(user):
+    refresh = RefreshToken.for_user(user)
+    return {'refresh': str(refresh), 'access': str(refresh.access_token)}
+
+
+@sync_to_async
+def _get_active_user(email):
+    return CustomUser.objects.filter(email=email, is_active=True).first()
+
+
+@sync_to_async
+def _email_taken(email):
+    return CustomUser.objects.filter(email=email).exists()
+
+
+@sync_to_async
+def _save_password(user, encoded):
+    user.password = encoded
+    user.save(update_fields=['password'])
+
+
+@sync_to_async
+def _save(user):
+    user.save()
+
+
+@_async_post_view
+async def signin(request):
+    throttled = await _check_rate('signin', request)
+    if throttled:
+        return throttled
+
+    data = _request_data(request)
+    email = data.get('email')
+    password = data.get('password')
+
+    if not email or not password:
+        return JsonResponse({'error': 'Email and password are required.'}, status=400)
+
+    user = await _get_active_user(email)
+    try:
+        if user is None:
+            # Hash anyway so unknown emails take as long as wrong passwords
+            await hashing.amake_password(password)
+            matches = False
+        else:
+            matches, needs_rehash = await hashing.acheck_password(password, user.password)
+            if matches and needs_rehash:
+                await _save_password(user, await hashing.amake_password(password))
+    except hashing.HashingBusy:
+        return _busy()
+
+    if not matches:
+        return JsonResponse({'error': 'Invalid Credentials'}, status=401)
+
+    return JsonResponse({
+        **await sync_to_async(_tokens)(user),
+        'user': {
+            'id': user.id,
+            'email': user.email,
+            'first_name': user.first_name,
+            'last_name': user.last_name
+        }
+    })
+
+
+@_async_post_view
+async def register(request):
+    throttled = await _check_rate('register', request)
+    if throttled:
+        return throttled
+
+    data = _request_data(request)
+    email = data.get('email')
+    password = data.get('password')
+    first_name = data.get('first_name')
+    last_name = data.get('last_name')
+    profile_picture = request.FILES.get('profile_picture')
+
+    if not email or not password or not first_name or not last_name:
+        return JsonResponse({'error': 'All fields are required.'}, status=400)
+
+    if await _email_taken(email):
+        return JsonResponse({'error': 'Email already exists.'}, status=400)
+
+    user = CustomUser(email=email, first_name=first_name, last_name=last_name, profile_picture=profile_picture)
+    try:
+        user.password = await hashing.amake_password(password)
+    except hashing.HashingBusy:
+        return _busy()
+    await _save(user)
+
+    return JsonResponse({
+        **await sync_to_async(_tokens)(user),
+        'user': {
+            'id': user.id,
+            'email': user.email,
+            'first_name': user.first_name,
+            'last_name': user.last_name,
+            'profile_picture': user.profile_picture.url if user.profile_picture else None
+        }
+    }, status=201)
+
+
+@_async_post_view
+async def change_password(request):
+    user = await sync_to_async(get_user_from_token)(request)
+    if user is None:
+        return JsonResponse({'error': 'Authentication credentials were not provided.'}, status=401)
+
+    data = _request_data(request)
+    current_password = data.get('current_password')
+    new_password = data.get('new_password')
+    if not current_password or not new_password:
+        return JsonResponse({'error': 'current_password and new_password are required.'}, status=400)
+
+    try:
+        matches, _ = await hashing.acheck_password(current_password, user.password)
+        if not matches:
+            return JsonResponse({'error': 'Current password is incorrect.'}, status=400)
+        encoded = await hashing.amake_password(new_password)
+    except hashing.HashingBusy:
+        return _busy()
+
+    # save() also drops the user's cached JWT snapshots
+    await _save_password(user, encoded)
+    return JsonResponse({'message': 'Password changed successfully.'})
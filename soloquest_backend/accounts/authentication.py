@@ -0,0 +1,123 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+
+
+class TokenUserCache:
+    """
+    Bounded LRU of validated access token -> (user snapshot, validated token).
+
+    Entries live for ``ttl`` seconds at most and never past the token's own
+    expiry.  Every entry of a user can be dropped at once with
+    ``invalidate_user`` (password change, profile save).
+    """
+
+    def __init__(self, max_entries=10000, ttl=60):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._by_user = {}
+        self._lock = threading.Lock()
+
+    def get(self, raw_token):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(raw_token)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    self._discard(raw_token)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(raw_token)
+            self.hits += 1
+            _, user, validated_token = entry
+        # Hand every request its own copy so views can't mutate the snapshot
+        return copy.copy(user), validated_token
+
+    def set(self, raw_token, user, validated_token):
+        expires_at = min(time.time() + self.ttl, validated_token.get('exp', float('inf')))
+        with self._lock:
+            self._discard(raw_token)
+            self._entries[raw_token] = (expires_at, copy.copy(user), validated_token)
+            self._by_user.setdefault(user.pk, set()).add(raw_token)
+            while len(self._entries) > self.max_entries:
+                self._discard(next(iter(self._entries)))
+
+    def invalidate_user(self, user_id):
+        with self._lock:
+            for raw_token in list(self._by_user.get(user_id, ())):
+                self._discard(raw_token)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_user.clear()
+
+    def _discard(self, raw_token):
+        entry = self._entries.pop(raw_token, None)
+        if entry is None:
+            return
+        tokens = self._by_user.get(entry[1].pk)
+        if tokens is not None:
+            tokens.discard(raw_token)
+            if not tokens:
+                del self._by_user[entry[1].pk]
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'size': len(self._entries),
+        }
+
+
+token_cache = TokenUserCache(
+    max_entries=getattr(settings, 'JWT_USER_CACHE_SIZE', 10000),
+    ttl=getattr(settings, 'JWT_USER_CACHE_TTL', 60),
+)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    SimpleJWT authentication that skips signature checks and the user lookup
+    for tokens it has validated recently.
+    """
+
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        cached = token_cache.get(raw_token)
+        if cached is not None:
+            return cached
+
+        validated_token = self.get_validated_token(raw_token)
+        user = self.get_user(validated_token)
+        token_cache.set(raw_token, user, validated_token)
+        return user, validated_token
+
+
+def get_user_from_token(request):
+    """
+    Authenticate a plain Django view's request with the same (cached) JWT
+    authentication DRF views use.  Returns the user, or None.
+    """
+    try:
+        result = CachedJWTAuthentication().authenticate(request)
+    except (AuthenticationFailed, InvalidToken):
+        return None
+    return result[0] if result else None
@@ -0,0 +1,52 @@
+import hashlib
+
+from django.conf import settings
+from django.db import models
+
+from .cache import VersionedCache, build_backend
+from .models import BlockedUser
+
+# user id -> frozenset of users hidden from them: everyone they blocked and
+# everyone who blocked them.  Dropped for both sides on block/unblock (see
+# signals.py) and rebuilt by the next read.
+block_cache = VersionedCache(build_backend(getattr(settings, 'BLOCK_CACHE', {})), 'blocks')
+
+
+def load_hidden_ids(user_id):
+    rows = BlockedUser.objects.filter(
+        models.Q(blocker_id=user_id) | models.Q(blocked_id=user_id)
+    ).values_list('blocker_id', 'blocked_id')
+    return frozenset(blocked if blocker == user_id else blocker for blocker, blocked in rows)
+
+
+def hidden_ids(user_id):
+    ids = block_cache.get(user_id)
+    if ids is None:
+        ids = load_hidden_ids(user_id)
+        block_cache.set(user_id, ids)
+    return ids
+
+
+def hidden_for(request):
+    user = request.user
+    return hidden_ids(user.pk) if user.is_authenticated else frozenset()
+
+
+def is_blocked(user_a_id, user_b_id):
+    """True if either user has blocked the other."""
+    return user_b_id in hidden_ids(user_a_id)
+
+
+def forget_blocks(*user_ids):
+    block_cache.delete(*user_ids)
+
+
+def hidden_variant(hidden):
+    """
+    Cache-key / ETag suffix for responses filtered by ``hidden``.  Viewers
+    without blocks share the plain variant.
+    """
+    if not hidden:
+        return ''
+    digest = hashlib.md5(','.join(map(str, sorted(hidden))).encode(), usedforsecurity=False).hexdigest()
+    return f"hide-{digest[:16]}"
@@ -0,0 +1,210 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.response import Response
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+
+def _initial_version():
+    # Seed missing versions from the clock so a version that was evicted or
+    # lost on restart never comes back with a number an old entry used.
+    return int(time.time() * 1000)
+
+
+class LRUCacheBackend:
+    """In-process LRU cache.  Only safe when the app runs in a single process."""
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                return None
+            return self._entries[key]
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def get_version(self, key):
+        with self._lock:
+            return self._versions.setdefault(key, _initial_version())
+
+    def bump_version(self, key):
+        with self._lock:
+            self._versions[key] = self._versions.get(key, _initial_version()) + 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+
+
+class DjangoCacheBackend:
+    """Stores entries and versions in one of the CACHES configured in settings."""
+
+    def __init__(self, alias='default', timeout=300):
+        self.alias = alias
+        self.timeout = timeout
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def get(self, key):
+        return self.cache.get(key)
+
+    def set(self, key, value):
+        self.cache.set(key, value, self.timeout)
+
+    def delete(self, key):
+        self.cache.delete(key)
+
+    def get_version(self, key):
+        version = self.cache.get(key)
+        if version is None:
+            version = _initial_version()
+            if not self.cache.add(key, version, None):
+                version = self.cache.get(key, version)
+        return version
+
+    def bump_version(self, key):
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            self.cache.set(key, _initial_version(), None)
+
+    def clear(self):
+        self.cache.clear()
+
+
+class VersionedCache:
+    """
+    Caches values under keys that embed version numbers.
+
+    Writers never delete entries; they bump the version of whatever changed,
+    so every key built afterwards misses and the stale entries simply age out
+    of the backend.
+    """
+
+    def __init__(self, backend, prefix):
+        self.backend = backend
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+
+    def _version_key(self, name):
+        return f"{self.prefix}:v:{name}"
+
+    def version(self, name):
+        return self.backend.get_version(self._version_key(name))
+
+    def bump(self, *names):
+        for name in names:
+            self.backend.bump_version(self._version_key(name))
+
+    def get(self, key):
+        value = self.backend.get(f"{self.prefix}:{key}")
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key, value):
+        self.backend.set(f"{self.prefix}:{key}", value)
+
+    def delete(self, *keys):
+        for key in keys:
+            self.backend.delete(f"{self.prefix}:{key}")
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+    def reset_stats(self):
+        self.hits = self.misses = 0
+
+
+def build_backend(options):
+    if options.get('BACKEND', 'lru') == 'django':
+        return DjangoCacheBackend(options.get('ALIAS', 'default'), options.get('TIMEOUT', 300))
+    return LRUCacheBackend(options.get('MAX_ENTRIES', 1024))
+
+
+def _plain(data):
+    """Strip DRF's ReturnList/ReturnDict wrappers so cached data pickles cleanly."""
+    if isinstance(data, (ReturnList, list)):
+        return [_plain(item) for item in data]
+    if isinstance(data, (ReturnDict, dict)):
+        return {key: _plain(value) for key, value in data.items()}
+    return data
+
+
+def cached_response(cache, key, build):
+    """Return a cached ``Response`` for ``key`` or build, cache and return it."""
+    data = cache.get(key)
+    if data is not None:
+        return Response(data)
+    response = build()
+    if response.status_code == 200:
+        cache.set(key, _plain(response.data))
+    return response
+
+
+# ---------------------------
+# Blog post cache
+# ---------------------------
+FEED = 'feed'
+TAGS = 'tags'
+CATEGORIES = 'categories'
+
+blog_cache = VersionedCache(build_backend(getattr(settings, 'BLOG_CACHE', {})), 'blog')
+
+
+def post_version_name(post_id):
+    return f"post:{post_id}"
+
+
+def _query_string(request):
+    return '&'.join(f"{k}={v}" for k, v in sorted(request.query_params.items()))
+
+
+def feed_key(request, variant=''):
+    return f"list:{blog_cache.version(FEED)}:{request.build_absolute_uri('/')}:{_query_string(request)}:{variant}"
+
+
+def tag_cloud_key(request):
+    return f"tags:{blog_cache.version(TAGS)}:{_query_string(request)}"
+
+
+def post_key(request, post_id, variant=''):
+    version = blog_cache.version(post_version_name(post_id))
+    return f"detail:{post_id}:{version}:{request.build_absolute_uri('/')}:{variant}"
+
+
+def invalidate_posts(post_ids, feed=True):
+    names = [post_version_name(post_id) for post_id in post_ids]
+    if feed:
+        names.append(FEED)
+    blog_cache.bump(*names)
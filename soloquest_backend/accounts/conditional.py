@@ -0,0 +1,42 @@
+import hashlib
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+
+def make_etag(*parts):
+    """Hash cheap validator parts (versions, counts, timestamps) into an ETag."""
+    raw = ':'.join(str(part) for part in parts)
+    return quote_etag(hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest())
+
+
+def conditional_response(request, build, etag_parts, last_modified=None, private=True):
+    """
+    Answer a GET with 304 Not Modified when the client's validators still
+    match, otherwise call ``build()`` for the full response.
+
+    ``etag_parts`` and ``last_modified`` must be computable without
+    serializing the body, so a revalidation costs at most one small query.
+    Per-user responses must include the user in ``etag_parts``.
+    """
+    if request.method not in ('GET', 'HEAD'):
+        return build()
+
+    etag = make_etag(request.get_full_path(), *etag_parts)
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is None:
+        response = build()
+    if response.status_code not in (200, 304):
+        return response
+
+    response.headers['ETag'] = etag
+    if timestamp is not None:
+        response.headers['Last-Modified'] = http_date(timestamp)
+    # Let browsers keep the body but revalidate on every use
+    if private:
+        patch_cache_control(response, no_cache=True, private=True)
+    else:
+        patch_cache_control(response, no_cache=True, public=True)
+    return response
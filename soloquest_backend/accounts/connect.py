@@ -0,0 +1,49 @@
+"""
+Everything the Connect page needs on load, in one response: friends,
+pending requests both ways and the top suggestions.  Each section lists
+user ids only; the cards themselves are serialized once, from a single
+query, into a ``users`` table keyed by id.
+"""
+from django.db import models
+
+from .friends import friend_ids, user_cards
+from .models import FriendRequest
+from .serializers import UserSerializer
+from .suggestions import ranked_suggestions
+
+SUGGESTION_LIMIT = 10
+
+
+def pending_requests(user):
+    # One query over both (sender|receiver, status, created_at) indexes
+    return list(
+        FriendRequest.objects.filter(models.Q(sender=user) | models.Q(receiver=user), status='pending')
+        .order_by('-created_at', '-id')
+        .values('id', 'sender_id', 'receiver_id', 'created_at')
+    )
+
+
+def bootstrap(request, suggestion_limit=SUGGESTION_LIMIT):
+    user = request.user
+    friends = sorted(friend_ids(user.pk))
+    requests = pending_requests(user)
+    suggestions = list(ranked_suggestions(user).values_list('candidate_id', 'mutual_count')[:suggestion_limit])
+
+    sent = [
+        {'id': r['id'], 'user': r['receiver_id'], 'created_at': r['created_at']}
+        for r in requests if r['sender_id'] == user.pk
+    ]
+    received = [
+        {'id': r['id'], 'user': r['sender_id'], 'created_at': r['created_at']}
+        for r in requests if r['sender_id'] != user.pk
+    ]
+
+    ids = {*friends, *(r['user'] for r in sent), *(r['user'] for r in received), *(c for c, _ in suggestions)}
+    cards = UserSerializer(user_cards(ids), many=True, context={'request': request}).data
+    return {
+        'users': {card['id']: card for card in cards},
+        'friends': friends,
+        'requests_sent': sent,
+        'requests_received': received,
+        'suggestions': [{'user': candidate, 'mutual_friends': count} for candidate, count in suggestions],
+    }
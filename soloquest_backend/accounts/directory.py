@@ -0,0 +1,36 @@
+from django.db import models
+
+from .models import CustomUser, fold_for_search
+from .pagination import KeysetPagination
+
+MAX_TERMS = 4
+
+
+def _prefix_range(prefix):
+    # 'ann' -> ['ann', 'ano'): a range both SQLite and Postgres can answer
+    # from the search_* column indexes, unlike LIKE 'ann%'
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def search_users(queryset, query):
+    """
+    Users where every whitespace-separated term of ``query`` is a
+    case-insensitive prefix of their name, first name, last name or email.
+    Terms are folded like the stored search_* columns, so "élo" finds "Élodie".
+    """
+    terms = fold_for_search(query).split()[:MAX_TERMS]
+    if not terms:
+        return queryset
+
+    for term in terms:
+        low, high = _prefix_range(term)
+        matches = models.Q()
+        for field in CustomUser.SEARCH_FIELDS:
+            matches |= models.Q(**{f'search_{field}__gte': low, f'search_{field}__lt': high})
+        queryset = queryset.filter(matches)
+    return queryset
+
+
+class UserDirectoryPagination(KeysetPagination):
+    """Keyset pages over users, newest members first."""
+    ordering_field = 'date_joined'
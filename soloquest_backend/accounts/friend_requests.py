@@ -0,0 +1,99 @@
+"""
+Bulk friend-request operations.  Each validates every id in one query and
+applies the changes in a single transaction, so "accept all" on the
+Connect page is one request instead of one per friend.
+"""
+from django.contrib.auth import get_user_model
+from django.db import models, transaction
+
+from .blocks import hidden_ids
+from .friends import friend_ids
+from .models import FriendRequest, Friendship
+from .ratelimit import client_ident, rate_limiter
+
+MAX_BATCH = 100
+
+
+def _report(done, requested):
+    return {'done': sorted(done), 'skipped': sorted(set(requested) - set(done))}
+
+
+def accept_requests(user, request_ids):
+    with transaction.atomic():
+        pending = list(
+            FriendRequest.objects.select_for_update()
+            .filter(id__in=request_ids, receiver=user, status='pending')
+        )
+        friends = friend_ids(user.pk)
+        senders = []
+        for friend_request in pending:
+            friend_request.status = 'accepted'
+            if friend_request.sender_id not in friends and friend_request.sender_id not in senders:
+                senders.append(friend_request.sender_id)
+        FriendRequest.objects.bulk_update(pending, ['status'])
+        # One friendship at a time, not bulk_create: the suggestion receiver
+        # counts mutual friends against the friend sets as they were just
+        # before each insert, or every pair of new friends is counted twice
+        for sender_id in senders:
+            Friendship.objects.create(user1_id=sender_id, user2_id=user.pk)
+    return _report([r.id for r in pending], request_ids)
+
+
+def decline_requests(user, request_ids):
+    with transaction.atomic():
+        pending = FriendRequest.objects.filter(id__in=request_ids, receiver=user, status='pending')
+        declined = list(pending.values_list('id', flat=True))
+        FriendRequest.objects.filter(id__in=declined).update(status='declined')
+    return _report(declined, request_ids)
+
+
+def delete_requests(user, request_ids):
+    with transaction.atomic():
+        owned = FriendRequest.objects.filter(models.Q(sender=user) | models.Q(receiver=user), id__in=request_ids)
+        deleted = list(owned.values_list('id', flat=True))
+        FriendRequest.objects.filter(id__in=deleted).delete()
+    return _report(deleted, request_ids)
+
+
+def send_requests(request, user_ids):
+    """
+    Send ``request.user``'s friend request to each of ``user_ids``.  Every
+    request counts against the "friend_request" rate limit; returns the
+    report and the Retry-After seconds if the limit cut the batch short.
+    """
+    sender = request.user
+    excluded = friend_ids(sender.pk) | hidden_ids(sender.pk) | {sender.pk}
+    wanted = [user_id for user_id in dict.fromkeys(user_ids) if user_id not in excluded]
+    receivers = set(
+        get_user_model().objects.filter(id__in=wanted, is_superuser=False).values_list('id', flat=True)
+    )
+
+    with transaction.atomic():
+        existing = {
+            r.receiver_id: r
+            for r in FriendRequest.objects.select_for_update().filter(sender=sender, receiver_id__in=receivers)
+        }
+        # Skip people who already asked us; those are for accept_requests
+        incoming = set(
+            FriendRequest.objects.filter(sender_id__in=receivers, receiver=sender, status='pending')
+            .values_list('sender_id', flat=True)
+        )
+
+        created, reopened, sent, wait = [], [], [], None
+        for receiver_id in (user_id for user_id in wanted if user_id in receivers):
+            previous = existing.get(receiver_id)
+            if receiver_id in incoming or (previous and previous.status == 'pending'):
+                continue
+            wait = rate_limiter.check('friend_request', client_ident(request))
+            if wait is not None:
+                break
+            if previous:
+                previous.status = 'pending'
+                reopened.append(previous)
+            else:
+                created.append(FriendRequest(sender=sender, receiver_id=receiver_id))
+            sent.append(receiver_id)
+
+        FriendRequest.objects.bulk_update(reopened, ['status'])
+        FriendRequest.objects.bulk_create(created)
+    return _report(sent, user_ids), wait
@@ -0,0 +1,65 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+
+from .cache import VersionedCache, build_backend
+from .models import Friendship
+
+# user id -> frozenset of friend ids.  Entries are dropped whenever one of
+# the user's friendships is created or deleted (see signals.py) and rebuilt
+# by the next read.
+friend_cache = VersionedCache(build_backend(getattr(settings, 'FRIEND_CACHE', {})), 'friends')
+
+# Columns UserSerializer renders
+CARD_FIELDS = ('id', 'email', 'first_name', 'last_name', 'profile_picture_variants')
+
+
+def friendship_between(user_a_id, user_b_id):
+    """The (at most one) Friendship row of two users, found by its unique index."""
+    user1_id, user2_id = Friendship.pair(user_a_id, user_b_id)
+    return Friendship.objects.filter(user1_id=user1_id, user2_id=user2_id)
+
+
+def befriend(user_a_id, user_b_id):
+    """Make two users friends; a no-op if they already are."""
+    user1_id, user2_id = Friendship.pair(user_a_id, user_b_id)
+    friendship, _ = Friendship.objects.get_or_create(user1_id=user1_id, user2_id=user2_id)
+    return friendship
+
+
+def load_friend_ids(user_id):
+    # Two index-only lookups, one per side of the stored pair, instead of
+    # an OR that has to visit the table
+    as_user1 = Friendship.objects.filter(user1_id=user_id).values_list('user2_id', flat=True)
+    as_user2 = Friendship.objects.filter(user2_id=user_id).values_list('user1_id', flat=True)
+    return frozenset(as_user1.union(as_user2, all=True))
+
+
+def friend_ids(user_id):
+    ids = friend_cache.get(user_id)
+    if ids is None:
+        ids = load_friend_ids(user_id)
+        friend_cache.set(user_id, ids)
+    return ids
+
+
+def are_friends(user_a_id, user_b_id):
+    return user_b_id in friend_ids(user_a_id)
+
+
+def forget_friends(*user_ids):
+    friend_cache.delete(*user_ids)
+
+
+def card_values(user_ids):
+    """The CARD_FIELDS of ``user_ids`` as plain tuples, ordered by id: a cheap ETag source for cards."""
+    if not user_ids:
+        return []
+    return list(
+        get_user_model().objects.filter(id__in=list(user_ids)).order_by('id').values_list(*CARD_FIELDS)
+    )
+
+
+def user_cards(user_ids):
+    """Users for ``user_ids`` in one query, ordered by id."""
+    users = get_user_model().objects.only(*CARD_FIELDS).in_bulk(list(user_ids))
+    return [users[user_id] for user_id in sorted(users)]
@@ -0,0 +1,101 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class HashingBusy(Exception):
+    """Raised when the hashing queue is full; callers should answer 503."""
+
+
+def _init_worker(settings_module):
+    # Spawned workers start from a blank interpreter
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+    import django
+    django.setup()
+
+
+def make_password(raw_password):
+    return hashers.make_password(raw_password)
+
+
+def _check_password(raw_password, encoded):
+    """Returns (matches, needs_rehash)."""
+    if not hashers.check_password(raw_password, encoded):
+        return False, False
+    return True, hashers.identify_hasher(encoded).must_update(encoded)
+
+
+def make_pool(workers):
+    """Spawn-context process pool whose workers have Django set up."""
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_worker,
+        initargs=(os.environ.get('DJANGO_SETTINGS_MODULE', 'soloquest_backend.settings'),),
+    )
+
+
+class HashingExecutor:
+    """
+    Process pool for PBKDF2 work, so hashing never holds the GIL or the event
+    loop of the process serving requests.
+
+    At most ``max_pending`` jobs are queued or running at once; beyond that
+    ``submit`` raises HashingBusy instead of letting a login burst queue
+    unbounded work.
+    """
+
+    def __init__(self, workers=2, max_pending=32):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = make_pool(self.workers)
+            return self._pool
+
+    def submit(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            raise HashingBusy()
+        try:
+            future = self._get_pool().submit(fn, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def warm_up(self):
+        """Start every worker now rather than on the first login."""
+        for future in [self.submit(make_password, 'warm-up') for _ in range(self.workers)]:
+            future.result()
+
+    def shutdown(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+
+executor = HashingExecutor(
+    workers=getattr(settings, 'PASSWORD_HASHING_WORKERS', 2),
+    max_pending=getattr(settings, 'PASSWORD_HASHING_MAX_PENDING', 32),
+)
+
+
+async def amake_password(raw_password):
+    return await asyncio.wrap_future(executor.submit(make_password, raw_password))
+
+
+async def acheck_password(raw_password, encoded):
+    """Returns (matches, needs_rehash), like User.check_password's setter hook."""
+    return await asyncio.wrap_future(executor.submit(_check_password, raw_password, encoded))
@@ -0,0 +1,178 @@
+import hashlib
+import io
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connection, transaction
+from PIL import Image, ImageOps
+
+from .cache import invalidate_posts
+
+logger = logging.getLogger(__name__)
+
+# name -> bounding box.  Images are scaled down to fit, never up.
+VARIANTS = {
+    'full': (1600, 1600),
+    'card': (640, 480),
+    'thumb': (160, 160),
+}
+FORMATS = {
+    'webp': {'format': 'WEBP', 'quality': 80, 'method': 4},
+    'jpeg': {'format': 'JPEG', 'quality': 82, 'optimize': True, 'progressive': True},
+}
+
+# model label -> (image field, variants field)
+IMAGE_FIELDS = {
+    'accounts.BlogPost': ('image', 'image_variants'),
+    'accounts.CustomUser': ('profile_picture', 'profile_picture_variants'),
+}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, 'IMAGE_VARIANT_WORKERS', 2),
+                thread_name_prefix='image-variants',
+            )
+        return _executor
+
+
+def variant_path(source_name, variant, extension):
+    # Keyed on the whole stored name, not just the stem, so a.png and a.jpg
+    # (on the same object or on two different ones) never share variants
+    directory, filename = os.path.split(source_name)
+    stem = os.path.splitext(filename)[0]
+    digest = hashlib.md5(source_name.encode(), usedforsecurity=False).hexdigest()[:12]
+    return os.path.join(directory, 'variants', f'{stem}-{digest}', f'{variant}.{extension}')
+
+
+def _encode(image, options):
+    options = dict(options)
+    image_format = options.pop('format')
+    if image_format == 'JPEG' and image.mode != 'RGB':
+        image = image.convert('RGB')
+    buffer = io.BytesIO()
+    image.save(buffer, image_format, **options)
+    return buffer.getvalue()
+
+
+def _save(path, content):
+    # Storage.save() renames on collision, so replace the old file explicitly
+    if default_storage.exists(path):
+        default_storage.delete(path)
+    return default_storage.save(path, ContentFile(content))
+
+
+def render_variants(field_file):
+    """
+    Write every variant of ``field_file`` to storage.
+
+    Returns ``{'source': name, variant: {extension: storage name}}``.
+    """
+    largest = max(VARIANTS.values())
+    with field_file.open('rb') as handle:
+        image = Image.open(handle)
+        # Let the JPEG decoder skip straight to a scale near the largest box
+        image.draft('RGB', largest)
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+        image.load()
+
+    result = {'source': field_file.name}
+    # Largest box first, so each smaller variant is resized from the previous one
+    for variant, box in sorted(VARIANTS.items(), key=lambda item: item[1], reverse=True):
+        image = image.copy()
+        image.thumbnail(box, Image.LANCZOS)
+        result[variant] = {
+            extension: _save(variant_path(field_file.name, variant, extension), _encode(image, options))
+            for extension, options in FORMATS.items()
+        }
+    return result
+
+
+def _paths(variants):
+    return {path for variant in VARIANTS for path in (variants or {}).get(variant, {}).values()}
+
+
+def delete_variants(variants, keep=None):
+    """Delete the files of ``variants``, except any that ``keep`` (another variants dict) still uses."""
+    for path in _paths(variants) - _paths(keep):
+        default_storage.delete(path)
+
+
+def needs_variants(instance, image_field, variants_field):
+    source = getattr(instance, image_field).name or ''
+    return source != (getattr(instance, variants_field) or {}).get('source', '')
+
+
+def process_instance(model_label, pk):
+    """Regenerate the variants of one object and store them on the row."""
+    model = apps.get_model(model_label)
+    image_field, variants_field = IMAGE_FIELDS[model_label]
+    instance = model.objects.filter(pk=pk).only(image_field, variants_field).first()
+    if instance is None or not needs_variants(instance, image_field, variants_field):
+        return False
+
+    field_file = getattr(instance, image_field)
+    old_variants = getattr(instance, variants_field)
+    variants = render_variants(field_file) if field_file else {}
+
+    # Only store the result if nobody uploaded a newer image meanwhile
+    rows = model.objects.filter(pk=pk)
+    if field_file:
+        rows = rows.filter(**{image_field: field_file.name})
+    updated = rows.update(**{variants_field: variants})
+    if not updated:
+        delete_variants(variants)
+        return False
+    if old_variants and old_variants.get('source') != variants.get('source'):
+        delete_variants(old_variants, keep=variants)
+
+    if model_label == 'accounts.BlogPost':
+        # update() bypasses post_save, so invalidate the cached post here
+        invalidate_posts([pk])
+    return True
+
+
+def _run_job(model_label, pk):
+    try:
+        process_instance(model_label, pk)
+    except Exception:
+        logger.exception("Failed to build image variants for %s %s", model_label, pk)
+    finally:
+        connection.close()
+
+
+def schedule(instance):
+    """Queue variant generation for ``instance`` once the current transaction commits."""
+    model_label = instance._meta.label
+    if getattr(settings, 'IMAGE_VARIANT_WORKERS', 2) <= 0:
+        transaction.on_commit(lambda: process_instance(model_label, instance.pk))
+    else:
+        transaction.on_commit(lambda: get_executor().submit(_run_job, model_label, instance.pk))
+
+
+def variant_urls(variants, request=None):
+    """Map stored variant names to (absolute, when a request is given) URLs."""
+    urls = {}
+    for variant in VARIANTS:
+        paths = (variants or {}).get(variant)
+        if not paths:
+            continue
+        urls[variant] = {}
+        for extension, path in paths.items():
+            url = default_storage.url(path)
+            urls[variant][extension] = request.build_absolute_uri(url) if request else url
+    return urls
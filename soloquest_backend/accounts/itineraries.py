@@ -0,0 +1,67 @@
+"""
+Listing a user's itineraries with their items.  Itineraries are read in
+keyset order and their items in one query per batch, grouped in Python,
+so the cost is two queries per page (or per streamed chunk) no matter
+how many itineraries or items there are.
+"""
+import json
+from collections import defaultdict
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .models import Itinerary, ItineraryItem
+from .pagination import KeysetPagination
+
+ITEM_FIELDS = ('id', 'date', 'time', 'location', 'activity', 'notes')
+
+# Itineraries per query while streaming a full history
+STREAM_CHUNK_SIZE = 200
+
+
+class ItineraryPagination(KeysetPagination):
+    """Keyset pages over a user's itineraries, newest first."""
+
+
+def user_itineraries(user_id):
+    return Itinerary.objects.filter(user_id=user_id).only('id', 'title', 'created_at')
+
+
+def itinerary_rows(itineraries):
+    """JSON-ready dicts for ``itineraries``, with all their items fetched in one query."""
+    items = defaultdict(list)
+    rows = (
+        ItineraryItem.objects.filter(itinerary_id__in=[itinerary.id for itinerary in itineraries])
+        .order_by('itinerary_id', 'id')
+        .values('itinerary_id', *ITEM_FIELDS)
+    )
+    for item in rows:
+        items[item.pop('itinerary_id')].append(item)
+
+    return [
+        {
+            "id": itinerary.id,
+            "title": itinerary.title,
+            "created_at": itinerary.created_at.strftime("%Y-%m-%d %H:%M"),
+            "items": items[itinerary.id],
+        }
+        for itinerary in itineraries
+    ]
+
+
+def stream_itineraries(user_id, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Yield the JSON array of every itinerary of ``user_id``, newest first,
+    one chunk of itineraries at a time so memory stays flat.
+    """
+    paginator = ItineraryPagination()
+    position, separator = None, ''
+    yield '['
+    while True:
+        chunk = list(paginator.seek(user_itineraries(user_id), position, reverse=False)[:chunk_size])
+        for row in itinerary_rows(chunk):
+            yield separator + json.dumps(row, cls=DjangoJSONEncoder)
+            separator = ','
+        if len(chunk) < chunk_size:
+            break
+        position = paginator.get_position(chunk[-1])
+    yield ']'
@@ -0,0 +1,82 @@
+import time
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models import Itinerary, ItineraryItem
+from accounts.serializers import ItinerarySerializer
+
+
+def make_payload(size):
+    start = date(2025, 1, 1)
+    return {
+        "title": f"Bench trip ({size} stops)",
+        "items": [
+            {
+                "date": (start + timedelta(days=i // 4)).isoformat(),
+                "time": "" if i % 3 else "09:30",
+                "location": f"Stop {i}",
+                "activity": "Sightseeing",
+                "notes": "",
+            }
+            for i in range(size)
+        ],
+    }
+
+
+def create_per_item(user, payload):
+    # The previous create_itinerary: one INSERT (and commit) per item
+    itinerary = Itinerary.objects.create(user=user, title=payload["title"])
+    for item in payload["items"]:
+        ItineraryItem.objects.create(
+            itinerary=itinerary,
+            date=item.get("date"),
+            time=item.get("time") or None,
+            location=item.get("location"),
+            activity=item.get("activity", ""),
+            notes=item.get("notes", ""),
+        )
+
+
+def create_bulk(user, payload):
+    serializer = ItinerarySerializer(data=payload)
+    serializer.is_valid(raise_exception=True)
+    serializer.save(user=user)
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark itinerary creation: one INSERT per item versus validated "
+        "bulk_create in a single transaction. Writes to the configured database "
+        "under a throwaway user that is deleted afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="Items per itinerary.")
+        parser.add_argument("--rounds", type=int, default=5, help="Best-of rounds.")
+
+    def handle(self, *args, **options):
+        user = get_user_model().objects.create(email="bench-itinerary@example.invalid", name="Bench")
+        try:
+            self.stdout.write(f"{'items':>6}{'strategy':>12}{'queries':>10}{'ms':>10}{'items/s':>12}")
+            for size in options["sizes"]:
+                payload = make_payload(size)
+                for name, create in (("per-item", create_per_item), ("bulk", create_bulk)):
+                    queries, seconds = self._run(create, user, payload, options["rounds"])
+                    self.stdout.write(f"{size:>6}{name:>12}{queries:>10}{seconds * 1e3:>10.1f}{size / seconds:>12.0f}")
+        finally:
+            user.delete()
+
+    def _run(self, create, user, payload, rounds):
+        with CaptureQueriesContext(connection) as captured:
+            create(user, payload)
+        timings = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            create(user, payload)
+            timings.append(time.perf_counter() - started)
+        Itinerary.objects.filter(user=user).delete()
+        return len(captured.captured_queries), min(timings)
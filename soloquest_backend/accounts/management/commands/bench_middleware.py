@@ -0,0 +1,76 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.http import JsonResponse
+from django.test import Client, override_settings
+from django.urls import path
+
+LEGACY_MIDDLEWARE = [
+    "django.middleware.security.SecurityMiddleware",
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "corsheaders.middleware.CorsMiddleware",
+    "django.middleware.common.CommonMiddleware",
+    "django.middleware.csrf.CsrfViewMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+]
+
+
+def ping(request):
+    return JsonResponse({"ok": True})
+
+
+# Served instead of the project URLconf so only the middleware is measured
+urlpatterns = [
+    path("api/ping/", ping),
+    path("session/ping/", ping),
+]
+
+SCENARIOS = [
+    ("api, bearer + session cookie", "/api/ping/", {"HTTP_AUTHORIZATION": "Bearer bench"}, True),
+    ("api, anonymous", "/api/ping/", {}, False),
+    ("non-api, session cookie", "/session/ping/", {}, True),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark per-request middleware overhead of the stock Django stack versus "
+        "settings.MIDDLEWARE (the path-aware stack) against a no-op view."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=5000, help="Requests per scenario and stack.")
+        parser.add_argument("--rounds", type=int, default=5, help="Best-of rounds.")
+
+    def handle(self, *args, **options):
+        from django.conf import settings
+
+        stacks = [("stock", LEGACY_MIDDLEWARE), ("path-aware", list(settings.MIDDLEWARE))]
+        self.stdout.write(f"{'scenario':<32}{'stack':<12}{'us/request':>12}")
+        for label, url, headers, session_cookie in SCENARIOS:
+            results = {}
+            for name, middleware in stacks:
+                with override_settings(ROOT_URLCONF=__name__, MIDDLEWARE=middleware):
+                    results[name] = self._run(url, headers, session_cookie, options["requests"], options["rounds"])
+                self.stdout.write(f"{label:<32}{name:<12}{results[name]:>12.1f}")
+            saved = results["stock"] - results["path-aware"]
+            self.stdout.write(f"{'':<32}{'saved':<12}{saved:>12.1f}")
+
+    def _run(self, url, headers, session_cookie, total, rounds):
+        from django.conf import settings
+
+        client = Client(HTTP_HOST="localhost")
+        if session_cookie:
+            client.cookies[settings.SESSION_COOKIE_NAME] = "bench-session-key"
+        for _ in range(min(total, 200)):
+            client.get(url, **headers)
+
+        timings = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            for _ in range(total):
+                client.get(url, **headers)
+            timings.append((time.perf_counter() - started) / total * 1e6)
+        return min(timings)
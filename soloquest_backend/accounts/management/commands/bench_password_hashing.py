@@ -0,0 +1,73 @@
+import asyncio
+import statistics
+import time
+
+from django.contrib.auth.hashers import check_password, make_password
+from django.core.management.base import BaseCommand
+
+from accounts import hashing
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark login password checks at N concurrent requests, hashing inline on "
+        "the event loop versus in the accounts.hashing process pool."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+        parser.add_argument("--requests", type=int, default=64, help="Logins per run.")
+
+    def handle(self, *args, **options):
+        encoded = make_password("bench-password")
+        hashing.executor.warm_up()
+        self.stdout.write(f"hasher: {encoded.split('$')[0]}, pool workers: {hashing.executor.workers}")
+        self.stdout.write(f"{'mode':<8}{'conc':>6}{'logins/s':>11}{'p50 ms':>9}{'p95 ms':>9}{'max stall ms':>14}")
+
+        for concurrency in options["concurrency"]:
+            for mode in ("inline", "pool"):
+                result = asyncio.run(self._run(mode, encoded, concurrency, options["requests"]))
+                self.stdout.write(
+                    f"{mode:<8}{concurrency:>6}{result['throughput']:>11.1f}"
+                    f"{result['p50']:>9.1f}{result['p95']:>9.1f}{result['stall']:>14.1f}"
+                )
+        hashing.executor.shutdown()
+
+    async def _run(self, mode, encoded, concurrency, total):
+        latencies = []
+        # Bound concurrency below the pool's queue limit so no run sees HashingBusy
+        gate = asyncio.Semaphore(min(concurrency, hashing.executor.max_pending))
+        stall = 0.0
+        done = asyncio.Event()
+
+        async def heartbeat():
+            # How late a 1 ms tick fires is how long any other request would wait
+            nonlocal stall
+            while not done.is_set():
+                expected = time.perf_counter() + 0.001
+                await asyncio.sleep(0.001)
+                stall = max(stall, time.perf_counter() - expected)
+
+        async def login():
+            async with gate:
+                started = time.perf_counter()
+                if mode == "inline":
+                    check_password("bench-password", encoded)
+                else:
+                    await hashing.acheck_password("bench-password", encoded)
+                latencies.append(time.perf_counter() - started)
+
+        ticker = asyncio.create_task(heartbeat())
+        started = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(total)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await ticker
+
+        latencies.sort()
+        return {
+            "throughput": total / elapsed,
+            "p50": statistics.median(latencies) * 1000,
+            "p95": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+            "stall": stall * 1000,
+        }
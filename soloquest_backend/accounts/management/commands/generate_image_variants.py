@@ -0,0 +1,52 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from accounts import images
+
+
+class Command(BaseCommand):
+    help = "Build resized WebP/JPEG variants for blog images and profile pictures that lack them."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=4)
+        parser.add_argument("--force", action="store_true", help="Rebuild variants that already exist.")
+
+    def handle(self, *args, **options):
+        jobs = []
+        for model_label, (image_field, variants_field) in images.IMAGE_FIELDS.items():
+            model = apps.get_model(model_label)
+            rows = model.objects.exclude(**{image_field: ""}).exclude(**{f"{image_field}__isnull": True})
+            if options["force"]:
+                rows.update(**{variants_field: {}})
+            for instance in rows.only(image_field, variants_field).iterator():
+                if images.needs_variants(instance, image_field, variants_field):
+                    jobs.append((model_label, instance.pk))
+
+        started = time.perf_counter()
+        built = failed = 0
+        with ThreadPoolExecutor(max_workers=max(options["workers"], 1)) as pool:
+            futures = {pool.submit(self._process, *job): job for job in jobs}
+            for future in as_completed(futures):
+                if future.result():
+                    built += 1
+                else:
+                    failed += 1
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Built variants for {built} of {len(jobs)} images in {elapsed:.2f}s"
+            + (f" ({failed} skipped or failed)" if failed else "")
+        ))
+
+    def _process(self, model_label, pk):
+        try:
+            return images.process_instance(model_label, pk)
+        except Exception as exc:
+            self.stderr.write(f"{model_label} {pk}: {exc}")
+            return False
+        finally:
+            connection.close()
@@ -0,0 +1,87 @@
+"""
+Path-aware variants of the session, CSRF, auth and messages middleware.
+
+The React client talks to /api/ with Bearer JWTs, so loading a session,
+checking CSRF and preparing message storage for those requests is pure
+overhead.  Each class below behaves exactly like its Django parent except
+on stateless requests, where it steps aside.  They subclass the originals
+so the admin's middleware system checks still pass.
+
+A request is stateless when its path starts with one of
+STATELESS_API_PREFIXES (and isn't listed in STATEFUL_API_PATHS) and it
+either sends an Authorization header or carries no session cookie.  Such
+a request never reads the session, so there is no ambient credential for
+CSRF to protect; browsers holding an admin session and no token keep the
+full stack.
+"""
+from django.conf import settings
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.middleware.csrf import CsrfViewMiddleware
+from django.utils.functional import SimpleLazyObject
+
+from .authentication import get_user_from_token
+
+
+def is_stateless(request):
+    stateless = getattr(request, '_stateless_api', None)
+    if stateless is None:
+        path = request.path_info
+        stateless = (
+            path.startswith(tuple(getattr(settings, 'STATELESS_API_PREFIXES', ('/api/',))))
+            and path not in getattr(settings, 'STATEFUL_API_PATHS', ())
+            and (
+                'HTTP_AUTHORIZATION' in request.META
+                or settings.SESSION_COOKIE_NAME not in request.COOKIES
+            )
+        )
+        request._stateless_api = stateless
+    return stateless
+
+
+class PathAwareSessionMiddleware(SessionMiddleware):
+    def process_request(self, request):
+        if not is_stateless(request):
+            super().process_request(request)
+
+    def process_response(self, request, response):
+        if is_stateless(request):
+            return response
+        return super().process_response(request, response)
+
+
+class PathAwareCsrfViewMiddleware(CsrfViewMiddleware):
+    def process_request(self, request):
+        if not is_stateless(request):
+            super().process_request(request)
+
+    def process_view(self, request, callback, callback_args, callback_kwargs):
+        if is_stateless(request):
+            return None
+        return super().process_view(request, callback, callback_args, callback_kwargs)
+
+    def process_response(self, request, response):
+        if is_stateless(request):
+            return response
+        return super().process_response(request, response)
+
+
+class PathAwareAuthenticationMiddleware(AuthenticationMiddleware):
+    def process_request(self, request):
+        if not is_stateless(request):
+            return super().process_request(request)
+        # No session here: plain Django views see the Bearer token's user
+        request.user = SimpleLazyObject(lambda: get_user_from_token(request) or AnonymousUser())
+
+
+class PathAwareMessageMiddleware(MessageMiddleware):
+    def process_request(self, request):
+        if not is_stateless(request):
+            super().process_request(request)
+
+    def process_response(self, request, response):
+        if is_stateless(request):
+            return response
+        return super().process_response(request, response)
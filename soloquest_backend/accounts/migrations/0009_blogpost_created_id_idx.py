@@ -0,0 +1,19 @@
+# Generated by Django 4.2.16 on 2026-10-18 19:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0008_itinerary_itineraryitem"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="blogpost",
+            index=models.Index(
+                fields=["created_at", "id"], name="blogpost_created_id_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.16 on 2026-10-18 19:34
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0009_blogpost_created_id_idx"),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name="like",
+            unique_together={("post", "user")},
+        ),
+    ]
@@ -0,0 +1,49 @@
+from django.db import DatabaseError, migrations
+
+# Frozen copy of the FTS5 schema as accounts.search defined it when this
+# migration was written; later changes to that module must not alter it.
+FTS_TABLE = "accounts_blogpost_fts"
+INDEXED_FIELDS = ("title", "content", "tags")
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    try:
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+            f"{', '.join(INDEXED_FIELDS)}, tokenize='porter unicode61')"
+        )
+    except DatabaseError:
+        # SQLite built without FTS5; search falls back to LIKE queries
+        return
+
+    BlogPost = apps.get_model("accounts", "BlogPost")
+    quote = schema_editor.quote_name
+    columns = ", ".join(
+        f"COALESCE({quote(BlogPost._meta.get_field(field).column)}, '')"
+        for field in INDEXED_FIELDS
+    )
+    schema_editor.execute(f"DELETE FROM {FTS_TABLE}")
+    schema_editor.execute(
+        f"INSERT INTO {FTS_TABLE} (rowid, {', '.join(INDEXED_FIELDS)}) "
+        f"SELECT {quote(BlogPost._meta.pk.column)}, {columns} "
+        f"FROM {quote(BlogPost._meta.db_table)}"
+    )
+    schema_editor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')")
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "sqlite":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0010_like_unique_post_user"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,59 @@
+from django.db import migrations
+
+# Frozen copy of accounts.tags as it was when this migration was written
+MAX_TAG_LENGTH = 50
+
+
+def split_tags(value):
+    names = []
+    for raw in (value or "").split(","):
+        name = raw.strip().lstrip("#").strip().lower()[:MAX_TAG_LENGTH]
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def get_or_create_tags(Tag, names):
+    Tag.objects.bulk_create(
+        [Tag(name=name) for name in names], batch_size=1000, ignore_conflicts=True
+    )
+    return {tag.name: tag for tag in Tag.objects.filter(name__in=names)}
+
+
+def split_existing_tags(apps, schema_editor):
+    BlogPost = apps.get_model("accounts", "BlogPost")
+    Tag = apps.get_model("accounts", "Tag")
+    PostTag = apps.get_model("accounts", "PostTag")
+
+    names_by_post = {
+        post_id: split_tags(tags)
+        for post_id, tags in BlogPost.objects.values_list("id", "tags").iterator()
+    }
+    all_names = sorted({name for names in names_by_post.values() for name in names})
+    tags = get_or_create_tags(Tag, all_names)
+
+    PostTag.objects.bulk_create(
+        [
+            PostTag(post_id=post_id, tag_id=tags[name].id)
+            for post_id, names in names_by_post.items()
+            for name in names
+        ],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+def clear_post_tags(apps, schema_editor):
+    apps.get_model("accounts", "PostTag").objects.all().delete()
+    apps.get_model("accounts", "Tag").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0012_tag_posttag"),
+    ]
+
+    operations = [
+        migrations.RunPython(split_existing_tags, clear_post_tags),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.16 on 2026-10-18 19:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0013_split_blogpost_tags"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="blogpost",
+            name="image_variants",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name="customuser",
+            name="profile_picture_variants",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -0,0 +1,42 @@
+from collections import defaultdict
+
+from django.db import migrations
+
+FANOUT_LIMIT = 500
+
+
+def populate_timelines(apps, schema_editor):
+    BlogPost = apps.get_model("accounts", "BlogPost")
+    Friendship = apps.get_model("accounts", "Friendship")
+    TimelineEntry = apps.get_model("accounts", "TimelineEntry")
+
+    friends = defaultdict(set)
+    for user1_id, user2_id in Friendship.objects.values_list("user1_id", "user2_id").iterator():
+        friends[user1_id].add(user2_id)
+        friends[user2_id].add(user1_id)
+
+    batch = []
+    posts = BlogPost.objects.values_list("id", "author_id", "created_at")
+    for post_id, author_id, created_at in posts.iterator():
+        readers = friends[author_id] if len(friends[author_id]) <= FANOUT_LIMIT else set()
+        for reader in readers | {author_id}:
+            batch.append(TimelineEntry(user_id=reader, post_id=post_id, created_at=created_at))
+        if len(batch) >= 1000:
+            TimelineEntry.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    TimelineEntry.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+def clear_timelines(apps, schema_editor):
+    apps.get_model("accounts", "TimelineEntry").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0016_timelineentry"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_timelines, clear_timelines),
+    ]
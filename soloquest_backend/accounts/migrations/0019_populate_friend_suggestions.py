@@ -0,0 +1,45 @@
+from collections import Counter, defaultdict
+from itertools import combinations
+
+from django.db import migrations
+
+
+def populate_suggestions(apps, schema_editor):
+    Friendship = apps.get_model("accounts", "Friendship")
+    FriendSuggestion = apps.get_model("accounts", "FriendSuggestion")
+
+    friends = defaultdict(set)
+    for user1_id, user2_id in Friendship.objects.values_list("user1_id", "user2_id").iterator():
+        if user1_id != user2_id:
+            friends[user1_id].add(user2_id)
+            friends[user2_id].add(user1_id)
+
+    # Every pair of one user's friends has that user in common
+    mutual = Counter()
+    for neighbours in friends.values():
+        for a, b in combinations(sorted(neighbours), 2):
+            mutual[a, b] += 1
+
+    batch = []
+    for (a, b), count in mutual.items():
+        batch.append(FriendSuggestion(user_id=a, candidate_id=b, mutual_count=count))
+        batch.append(FriendSuggestion(user_id=b, candidate_id=a, mutual_count=count))
+        if len(batch) >= 1000:
+            FriendSuggestion.objects.bulk_create(batch)
+            batch = []
+    FriendSuggestion.objects.bulk_create(batch)
+
+
+def clear_suggestions(apps, schema_editor):
+    apps.get_model("accounts", "FriendSuggestion").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0018_friendsuggestion"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_suggestions, clear_suggestions),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.16 on 2026-10-18 19:59
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0019_populate_friend_suggestions"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(
+                django.db.models.functions.text.Lower("name"), name="user_name_ci_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(
+                django.db.models.functions.text.Lower("first_name"),
+                name="user_first_name_ci_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(
+                django.db.models.functions.text.Lower("last_name"),
+                name="user_last_name_ci_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(
+                django.db.models.functions.text.Lower("email"), name="user_email_ci_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(fields=["date_joined", "id"], name="user_joined_id_idx"),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.16 on 2026-10-18 20:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0020_user_directory_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="friendrequest",
+            index=models.Index(
+                fields=["receiver", "status", "created_at"],
+                name="friendreq_receiver_status_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="friendrequest",
+            index=models.Index(
+                fields=["sender", "status", "created_at"],
+                name="friendreq_sender_status_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+from django.db import migrations
+from django.db.models import F
+
+BATCH = 500
+
+
+def canonicalize_friendships(apps, schema_editor):
+    """
+    Store every friendship once, lower user id first: drop self-friendships
+    and the later of two rows for the same pair, then flip the rest.
+    """
+    Friendship = apps.get_model("accounts", "Friendship")
+    Friendship.objects.filter(user1_id=F("user2_id")).delete()
+
+    seen, duplicates, reversed_rows = set(), [], []
+    rows = Friendship.objects.order_by("created_at", "id").values_list(
+        "id", "user1_id", "user2_id"
+    )
+    for pk, user1_id, user2_id in rows.iterator():
+        pair = (min(user1_id, user2_id), max(user1_id, user2_id))
+        if pair in seen:
+            duplicates.append(pk)
+            continue
+        seen.add(pair)
+        if user1_id > user2_id:
+            reversed_rows.append(pk)
+
+    for i in range(0, len(duplicates), BATCH):
+        Friendship.objects.filter(id__in=duplicates[i : i + BATCH]).delete()
+    for i in range(0, len(reversed_rows), BATCH):
+        Friendship.objects.filter(id__in=reversed_rows[i : i + BATCH]).update(
+            user1_id=F("user2_id"), user2_id=F("user1_id")
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0021_friendrequest_status_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(canonicalize_friendships, migrations.RunPython.noop),
+    ]
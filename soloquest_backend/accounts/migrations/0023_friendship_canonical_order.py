@@ -0,0 +1,24 @@
+# Generated by Django 4.2.16 on 2026-10-18 20:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0022_canonical_friendships"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="friendship",
+            index=models.Index(fields=["user2", "user1"], name="friendship_user2_idx"),
+        ),
+        migrations.AddConstraint(
+            model_name="friendship",
+            constraint=models.CheckConstraint(
+                check=models.Q(("user1__lt", models.F("user2"))),
+                name="friendship_canonical_order",
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.16 on 2026-10-18 20:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0023_friendship_canonical_order"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="itinerary",
+            index=models.Index(
+                fields=["user", "created_at", "id"], name="itinerary_user_created_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 4.2.16 on 2026-10-18 20:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0024_itinerary_user_created_idx"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="customuser",
+            name="user_name_ci_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="customuser",
+            name="user_first_name_ci_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="customuser",
+            name="user_last_name_ci_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="customuser",
+            name="user_email_ci_idx",
+        ),
+        migrations.AddField(
+            model_name="customuser",
+            name="search_email",
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name="customuser",
+            name="search_first_name",
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name="customuser",
+            name="search_last_name",
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name="customuser",
+            name="search_name",
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(fields=["search_name"], name="user_search_name_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(
+                fields=["search_first_name"], name="user_search_first_name_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(
+                fields=["search_last_name"], name="user_search_last_name_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(fields=["search_email"], name="user_search_email_idx"),
+        ),
+    ]
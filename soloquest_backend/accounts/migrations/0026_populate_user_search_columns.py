@@ -0,0 +1,35 @@
+import unicodedata
+
+from django.db import migrations
+
+SEARCH_FIELDS = ("name", "first_name", "last_name", "email")
+
+
+def fold_for_search(value):
+    # Frozen copy of accounts.models.fold_for_search
+    return unicodedata.normalize("NFKC", value or "").casefold()[:255]
+
+
+def populate_search_columns(apps, schema_editor):
+    CustomUser = apps.get_model("accounts", "CustomUser")
+    search_fields = [f"search_{field}" for field in SEARCH_FIELDS]
+    batch = []
+    for user in CustomUser.objects.only("id", *SEARCH_FIELDS).iterator(chunk_size=1000):
+        for field in SEARCH_FIELDS:
+            setattr(user, f"search_{field}", fold_for_search(getattr(user, field)))
+        batch.append(user)
+        if len(batch) >= 1000:
+            CustomUser.objects.bulk_update(batch, search_fields)
+            batch = []
+    CustomUser.objects.bulk_update(batch, search_fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0025_user_search_columns"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_search_columns, migrations.RunPython.noop),
+    ]
@@ -1,3 +1,4 @@
+import unicodedata
 from datetime import date
 from typing import Any, Dict, List, Tuple  # Added Dict along with List and Tuple
 from django.conf import settings
@@ -61,12 +62,34 @@ class Friendship(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
+        # One row per pair, lower id first: the unique index answers
+        # lookups by user1, friendship_user2_idx the ones by user2
         unique_together = ('user1', 'user2')
+        indexes = [
+            models.Index(fields=['user2', 'user1'], name='friendship_user2_idx'),
+        ]
+        constraints = [
+            models.CheckConstraint(check=models.Q(user1__lt=models.F('user2')), name='friendship_canonical_order'),
+        ]
+
+    @staticmethod
+    def pair(user_a_id, user_b_id):
+        """``(user1_id, user2_id)`` under which two users' friendship is stored."""
+        return (user_a_id, user_b_id) if user_a_id < user_b_id else (user_b_id, user_a_id)
+
+    def save(self, *args, **kwargs):
+        self.user1_id, self.user2_id = self.pair(self.user1_id, self.user2_id)
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.user1} is friends with {self.user2}"
 
 
+def fold_for_search(value):
+    """Unicode-aware case folding for prefix search: 'Élodie' -> 'élodie'."""
+    return unicodedata.normalize('NFKC', value or '').casefold()[:255]
+
+
 class CustomUser(AbstractUser):
     """Defines the custom user model with email as the unique identifier."""
     
@@ -76,6 +99,16 @@ class CustomUser(AbstractUser):
     email = models.EmailField(unique=True, null=False, blank=False)
     date_of_birth = models.DateField(null=False, blank=False, default=date(2000, 1, 1))
     profile_picture = models.ImageField(upload_to="profile_pictures/", null=True, blank=True)
+    profile_picture_variants = models.JSONField(default=dict, blank=True, editable=False)  # Filled by accounts.images
+
+    # Case-folded copies of SEARCH_FIELDS for the user directory (accounts.directory).
+    # Folded in Python because SQLite's LOWER() only folds ASCII.
+    search_name = models.CharField(max_length=255, blank=True, editable=False)
+    search_first_name = models.CharField(max_length=255, blank=True, editable=False)
+    search_last_name = models.CharField(max_length=255, blank=True, editable=False)
+    search_email = models.CharField(max_length=255, blank=True, editable=False)
+
+    SEARCH_FIELDS = ('name', 'first_name', 'last_name', 'email')
 
     # Friends system with custom Friendship model
     friends = models.ManyToManyField(
@@ -104,6 +137,31 @@ class CustomUser(AbstractUser):
         related_query_name='customuser'
     )
     
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Case-insensitive prefix search in the user directory (accounts.directory)
+            models.Index(fields=['search_name'], name='user_search_name_idx'),
+            models.Index(fields=['search_first_name'], name='user_search_first_name_idx'),
+            models.Index(fields=['search_last_name'], name='user_search_last_name_idx'),
+            models.Index(fields=['search_email'], name='user_search_email_idx'),
+            models.Index(fields=['date_joined', 'id'], name='user_joined_id_idx'),
+        ]
+
+    def refresh_search_fields(self):
+        """Recompute the search_* columns; save() does this, bulk_create callers must."""
+        for field in self.SEARCH_FIELDS:
+            setattr(self, f'search_{field}', fold_for_search(getattr(self, field)))
+
+    def save(self, *args, **kwargs):
+        self.refresh_search_fields()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {
+                *update_fields,
+                *(f'search_{field}' for field in self.SEARCH_FIELDS if field in update_fields),
+            }
+        super().save(*args, **kwargs)
+
     def __str__(self) -> str:
         """Returns the user's email as a string representation."""
         return self.email
@@ -120,15 +178,61 @@ class BlogPost(models.Model):
     title = models.CharField(max_length=255)
     content = models.TextField()
     image = models.ImageField(upload_to='blog_images/', null=True, blank=True)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)  # Filled by accounts.images
     tags = models.CharField(max_length=255)
     category = models.ForeignKey(Category, on_delete=models.SET_NULL, null=True)
     is_published = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     likes_count = models.PositiveIntegerField(default=0)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='blogpost_created_id_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
+class Tag(models.Model):
+    """Normalised (lower-cased, trimmed) tag name; see accounts.tags."""
+    name = models.CharField(max_length=50, unique=True)
+
+    def __str__(self):
+        return self.name
+
+class PostTag(models.Model):
+    """Indexed through-table linking a BlogPost to each tag in its `tags` string."""
+    post = models.ForeignKey(BlogPost, on_delete=models.CASCADE, related_name='post_tags')
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE, related_name='post_tags')
+
+    class Meta:
+        unique_together = ('post', 'tag')
+        indexes = [
+            models.Index(fields=['tag', 'post'], name='posttag_tag_post_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.post} #{self.tag}"
+
+class TimelineEntry(models.Model):
+    """
+    One post in one user's friends-first timeline, written when the post is
+    published (fan-out-on-write, see accounts.timeline).  created_at copies
+    the post's so the timeline pages on its own index.
+    """
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='timeline_entries')
+    post = models.ForeignKey(BlogPost, on_delete=models.CASCADE, related_name='timeline_entries')
+    created_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = ('user', 'post')
+        indexes = [
+            models.Index(fields=['user', 'created_at', 'post'], name='timeline_user_created_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.post} in {self.user}'s timeline"
+
 class Comment(models.Model):
     post = models.ForeignKey(BlogPost, on_delete=models.CASCADE, related_name='comments')
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
@@ -139,6 +243,9 @@ class Like(models.Model):
     post = models.ForeignKey(BlogPost, on_delete=models.CASCADE, related_name='likes')
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ('post', 'user')  # One like per user per post
     
     
 from django.db import models
@@ -169,6 +276,11 @@ class FriendRequest(models.Model):
 
     class Meta:
         unique_together = ('sender', 'receiver')
+        indexes = [
+            # Inbox / outbox by status, newest first
+            models.Index(fields=['receiver', 'status', 'created_at'], name='friendreq_receiver_status_idx'),
+            models.Index(fields=['sender', 'status', 'created_at'], name='friendreq_sender_status_idx'),
+        ]
 
     def __str__(self):
         return f"{self.sender} -> {self.receiver} ({self.status})"
@@ -184,6 +296,26 @@ class BlockedUser(models.Model):
 
     def __str__(self):
         return f"{self.blocker} blocked {self.blocked}"
+
+
+class FriendSuggestion(models.Model):
+    """
+    How many friends ``user`` and ``candidate`` have in common, kept up to
+    date as friendships come and go (see accounts.suggestions).  Stored for
+    both directions so a user's suggestions are one index range.
+    """
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='friend_suggestions')
+    candidate = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='+')
+    mutual_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ('user', 'candidate')
+        indexes = [
+            models.Index(fields=['user', '-mutual_count', 'candidate'], name='suggestion_user_rank_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.candidate} for {self.user} ({self.mutual_count} mutual)"
     
 from django.db import models
 from django.contrib.auth.models import User
@@ -192,6 +324,13 @@ class Itinerary(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     title = models.CharField(max_length=100)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # A user's itineraries newest first, and keyset pages over them (accounts.itineraries)
+            models.Index(fields=['user', 'created_at', 'id'], name='itinerary_user_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.user.username}"
@@ -0,0 +1,136 @@
+import base64
+from collections import OrderedDict
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination ordered by (created_at, id), newest first.
+
+    Each page is one indexed range query of page_size + 1 rows, so cost and
+    memory stay constant no matter how deep the client scrolls.  Pagination is
+    opt-in: it only kicks in when the request carries ?cursor= or ?page_size=,
+    so existing clients that expect a plain list keep working.
+    """
+    page_size = 20
+    max_page_size = 100
+    ordering_field = 'created_at'
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def is_requested(self, request):
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request):
+            return None
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.reverse, position = self.decode_cursor(request)
+
+        queryset = self.seek(queryset, position, self.reverse)
+        results = list(queryset[:self.page_size + 1])
+        return self.paginate_results(results, position)
+
+    def seek(self, queryset, position, reverse, tiebreak_field='id'):
+        """Order ``queryset`` and skip to just past ``position`` (a (value, pk) pair)."""
+        field = self.ordering_field
+        if position is None:
+            return queryset.order_by(f'-{field}', f'-{tiebreak_field}')
+        value, pk = position
+        if reverse:
+            return queryset.filter(
+                Q(**{f'{field}__gt': value}) | Q(**{field: value, f'{tiebreak_field}__gt': pk})
+            ).order_by(field, tiebreak_field)
+        return queryset.filter(
+            Q(**{f'{field}__lt': value}) | Q(**{field: value, f'{tiebreak_field}__lt': pk})
+        ).order_by(f'-{field}', f'-{tiebreak_field}')
+
+    def paginate_results(self, results, position):
+        """Trim up to page_size + 1 rows fetched by seek() into the current page."""
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+
+        if self.reverse:
+            results.reverse()
+            self.has_next = position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+
+        self.page = results
+        return results
+
+    # ---------------------------
+    # Cursor encoding
+    # ---------------------------
+    def get_position(self, obj):
+        return getattr(obj, self.ordering_field), obj.pk
+
+    def encode_cursor(self, obj, reverse):
+        value, pk = self.get_position(obj)
+        raw = f"{'p' if reverse else 'n'}|{value.isoformat()}|{pk}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return False, None
+        try:
+            raw = base64.urlsafe_b64decode(token.encode()).decode()
+            direction, value, pk = raw.split('|')
+            value = parse_datetime(value)
+            pk = int(pk)
+        except (TypeError, ValueError, UnicodeDecodeError):
+            raise NotFound(self.invalid_cursor_message)
+        if value is None or direction not in ('n', 'p'):
+            raise NotFound(self.invalid_cursor_message)
+        return direction == 'p', (value, pk)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.page[-1], False))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        url = self.request.build_absolute_uri()
+        if not self.page:
+            return remove_query_param(url, self.cursor_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.page[0], True))
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
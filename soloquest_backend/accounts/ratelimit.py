@@ -0,0 +1,164 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.cache import caches
+from rest_framework.throttling import BaseThrottle
+
+PERIODS = {'s': 1, 'sec': 1, 'm': 60, 'min': 60, 'h': 3600, 'hour': 3600, 'd': 86400, 'day': 86400}
+
+
+def parse_rate(rate):
+    """'10/min' -> (10, 60).  None disables the limit."""
+    if rate is None:
+        return None
+    count, period = rate.split('/')
+    count = int(count)
+    if count < 1:
+        # _retry_after divides by the request count; use None to disable a scope
+        raise ImproperlyConfigured(f"Rate {rate!r} must allow at least one request per period.")
+    return count, PERIODS[period]
+
+
+def _estimate(previous, current, elapsed, period):
+    # Sliding window counter: the previous fixed window is weighted by how
+    # much of it still overlaps the sliding window ending now
+    return previous * (1 - elapsed / period) + current
+
+
+def _retry_after(previous, current, elapsed, limit, period):
+    """Seconds until one more request fits under ``limit`` again."""
+    if current < limit:
+        wait = period * (1 - (limit - current - 1) / previous) - elapsed
+    else:
+        # Nothing more fits in this window; wait for the next one to discount it
+        wait = (period - elapsed) + period * (1 - (limit - 1) / current)
+    return max(1, math.ceil(wait))
+
+
+class LocalRateLimitBackend:
+    """
+    In-process sliding-window counters.  Limits are per worker process, so
+    only use this with a single process (or as a cheap first line).
+    """
+
+    def __init__(self, max_keys=100000):
+        self.max_keys = max_keys
+        self._windows = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key, limit, period, now):
+        window, elapsed = divmod(now, period)
+        with self._lock:
+            start, current, previous = self._windows.get(key, (window, 0, 0))
+            if start != window:
+                previous = current if start == window - 1 else 0
+                current = 0
+            if _estimate(previous, current + 1, elapsed, period) > limit:
+                self._windows[key] = (window, current, previous)
+                return _retry_after(previous, current, elapsed, limit, period)
+            self._windows[key] = (window, current + 1, previous)
+            self._windows.move_to_end(key)
+            while len(self._windows) > self.max_keys:
+                self._windows.popitem(last=False)
+        return None
+
+    def clear(self):
+        with self._lock:
+            self._windows.clear()
+
+
+class CacheRateLimitBackend:
+    """
+    Sliding-window counters in one of the CACHES, shared by every worker.
+    A check is one get_many plus one incr; LocMemCache stands in for the
+    shared cache in development.
+    """
+
+    def __init__(self, alias='default'):
+        self.alias = alias
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def hit(self, key, limit, period, now):
+        window, elapsed = divmod(now, period)
+        window = int(window)
+        current_key, previous_key = f"rl:{key}:{window}", f"rl:{key}:{window - 1}"
+        counts = self.cache.get_many([current_key, previous_key])
+        previous = counts.get(previous_key, 0)
+        current = counts.get(current_key, 0)
+        if _estimate(previous, current + 1, elapsed, period) > limit:
+            return _retry_after(previous, current, elapsed, limit, period)
+        # Two windows' worth of lifetime keeps the previous count readable
+        if not self.cache.add(current_key, 1, period * 2):
+            try:
+                self.cache.incr(current_key)
+            except ValueError:
+                self.cache.set(current_key, 1, period * 2)
+        return None
+
+    def clear(self):
+        self.cache.clear()
+
+
+def build_backend(options):
+    if options.get('BACKEND', 'local') == 'cache':
+        return CacheRateLimitBackend(options.get('ALIAS', 'default'))
+    return LocalRateLimitBackend(options.get('MAX_KEYS', 100000))
+
+
+class RateLimiter:
+    def __init__(self, backend, rates):
+        self.backend = backend
+        self.rates = {scope: parse_rate(rate) for scope, rate in rates.items()}
+
+    def check(self, scope, ident):
+        """Count a request; returns None if allowed, else seconds to wait."""
+        rate = self.rates.get(scope)
+        if rate is None:
+            return None
+        limit, period = rate
+        return self.backend.hit(f"{scope}:{ident}", limit, period, time.time())
+
+
+_options = getattr(settings, 'RATE_LIMIT', {})
+rate_limiter = RateLimiter(build_backend(_options), _options.get('RATES', {}))
+
+
+def address_ident(request):
+    # Honours REST_FRAMEWORK['NUM_PROXIES'] like DRF's own throttles
+    return f"ip:{BaseThrottle().get_ident(request)}"
+
+
+def client_ident(request):
+    """Per-user for authenticated requests, per client address otherwise."""
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return f"user:{user.pk}"
+    return address_ident(request)
+
+
+class ScopedRateLimit(BaseThrottle):
+    """
+    DRF throttle backed by ``rate_limiter``; DRF turns a refusal into 429
+    with Retry-After.  Build one per scope with ``rate_limited()``.
+    """
+    scope = None
+
+    def allow_request(self, request, view):
+        self.retry_after = rate_limiter.check(self.scope, client_ident(request))
+        return self.retry_after is None
+
+    def wait(self):
+        return self.retry_after
+
+
+def rate_limited(scope):
+    """Throttle class for one of the scopes in settings.RATE_LIMIT['RATES']."""
+    name = scope.title().replace('_', '') + 'RateLimit'
+    return type(name, (ScopedRateLimit,), {'scope': scope})
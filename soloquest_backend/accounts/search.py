@@ -0,0 +1,176 @@
+import re
+
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils.html import escape
+
+FTS_TABLE = 'accounts_blogpost_fts'
+INDEXED_FIELDS = ('title', 'content', 'tags')
+
+# bm25 column weights, in INDEXED_FIELDS order: a hit in the title counts
+# for more than one in the tags, which counts for more than one in the body.
+BM25_WEIGHTS = (10.0, 1.0, 5.0)
+
+# Private-use markers survive HTML escaping, so the snippet can be escaped
+# first and the highlight tags put back afterwards.
+_MARK_OPEN, _MARK_CLOSE = '\x02', '\x03'
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+_fts_available = None
+
+
+def fts_available():
+    """True when the database is SQLite and the FTS5 index table exists."""
+    global _fts_available
+    if _fts_available is None:
+        _fts_available = (
+            connection.vendor == 'sqlite'
+            and FTS_TABLE in connection.introspection.table_names()
+        )
+    return _fts_available
+
+
+def create_index(schema_editor=None):
+    """Create the FTS5 table.  Returns False when FTS5 isn't available."""
+    global _fts_available
+    conn = schema_editor.connection if schema_editor else connection
+    if conn.vendor != 'sqlite':
+        return False
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+                f"{', '.join(INDEXED_FIELDS)}, tokenize='porter unicode61')"
+            )
+    except Exception:
+        # SQLite built without FTS5; search falls back to LIKE queries
+        return False
+    _fts_available = None
+    return True
+
+
+def drop_index(schema_editor=None):
+    global _fts_available
+    conn = schema_editor.connection if schema_editor else connection
+    if conn.vendor == 'sqlite':
+        with conn.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+    _fts_available = None
+
+
+def _row(post):
+    return (post.pk, *(getattr(post, field) or '' for field in INDEXED_FIELDS))
+
+
+def index_posts(posts):
+    """Insert or replace the index rows for ``posts``."""
+    if not fts_available():
+        return
+    rows = [_row(post) for post in posts]
+    if not rows:
+        return
+    placeholders = ', '.join(['%s'] * (len(INDEXED_FIELDS) + 1))
+    with connection.cursor() as cursor:
+        cursor.executemany(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [(row[0],) for row in rows])
+        cursor.executemany(
+            f"INSERT INTO {FTS_TABLE} (rowid, {', '.join(INDEXED_FIELDS)}) VALUES ({placeholders})",
+            rows,
+        )
+
+
+def unindex_post(post_id):
+    if not fts_available():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [post_id])
+
+
+def rebuild_index(queryset, batch_size=1000):
+    """Repopulate the index from ``queryset``.  Returns the number of rows indexed."""
+    count = 0
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        batch = []
+        for post in queryset.only(*INDEXED_FIELDS).iterator(chunk_size=batch_size):
+            batch.append(post)
+            if len(batch) >= batch_size:
+                index_posts(batch)
+                count += len(batch)
+                batch = []
+        index_posts(batch)
+        count += len(batch)
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')")
+    return count
+
+
+def _highlight(snippet):
+    return escape(snippet).replace(_MARK_OPEN, '<mark>').replace(_MARK_CLOSE, '</mark>')
+
+
+def _match_expression(terms):
+    # Quote every term so user input can never be parsed as FTS5 syntax, and
+    # prefix-match the last one so results show up while the user is typing.
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += '*'
+    return ' '.join(quoted)
+
+
+def _fts_search(terms, limit):
+    weights = ', '.join(str(weight) for weight in BM25_WEIGHTS)
+    sql = (
+        f"SELECT rowid, bm25({FTS_TABLE}, {weights}) AS rank, "
+        f"snippet({FTS_TABLE}, 1, %s, %s, '…', 16) "
+        f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s ORDER BY rank LIMIT %s"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [_MARK_OPEN, _MARK_CLOSE, _match_expression(terms), limit])
+        return [(post_id, rank, _highlight(snippet)) for post_id, rank, snippet in cursor.fetchall()]
+
+
+def _excerpt(text, terms, width=80):
+    lowered = text.lower()
+    start = min((lowered.find(term) for term in terms if term in lowered), default=0)
+    start = max(start - width // 4, 0)
+    excerpt = text[start:start + width]
+    for term in terms:
+        excerpt = re.sub(f'({re.escape(term)})', f'{_MARK_OPEN}\\1{_MARK_CLOSE}', excerpt, flags=re.IGNORECASE)
+    prefix = '…' if start else ''
+    suffix = '…' if start + width < len(text) else ''
+    return _highlight(f'{prefix}{excerpt}{suffix}')
+
+
+def _fallback_search(queryset, terms, limit):
+    condition = Q()
+    for term in terms:
+        condition &= Q(title__icontains=term) | Q(content__icontains=term) | Q(tags__icontains=term)
+    posts = queryset.filter(condition).order_by('-created_at', '-id')[:limit]
+    return [(post.pk, None, _excerpt(post.content, terms)) for post in posts]
+
+
+def search_posts(queryset, query, limit=20):
+    """
+    Full-text search over ``queryset``.
+
+    Returns ``(post, rank, snippet)`` tuples, best match first.  ``rank`` is
+    the bm25 score (lower is better) or ``None`` on the LIKE fallback.
+    """
+    terms = [term.lower() for term in _TOKEN_RE.findall(query or '')]
+    if not terms:
+        return []
+
+    if fts_available():
+        # Over-fetch a little so rows filtered out of ``queryset`` don't
+        # leave the page short.
+        hits = _fts_search(terms, limit * 2)
+    else:
+        hits = _fallback_search(queryset, terms, limit)
+
+    posts = queryset.in_bulk([post_id for post_id, _, _ in hits])
+    return [
+        (posts[post_id], rank, snippet)
+        for post_id, rank, snippet in hits
+        if post_id in posts
+    ][:limit]
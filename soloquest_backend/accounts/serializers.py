@@ -3,8 +3,9 @@ from .models import CustomUser
 from .models import BlogPost
     
 from rest_framework import serializers
-from .models import BlogPost, Category, Comment, Like
+from .models import BlogPost, Category, Comment, Like, Tag
 from .models import Friendship
+from .images import variant_urls
 
 class UserSignUpSerializer(serializers.ModelSerializer):
     """Serializer for user registration"""
@@ -34,14 +35,44 @@ class CategorySerializer(serializers.ModelSerializer):
 
 class BlogPostSerializer(serializers.ModelSerializer):
     author_name = serializers.SerializerMethodField()
+    comment_count = serializers.SerializerMethodField()
+    comments = serializers.SerializerMethodField()
+    image_variants = serializers.SerializerMethodField()
 
     class Meta:
         model = BlogPost
-        fields = ['id', 'title', 'content', 'image', 'tags', 'category', 'is_published', 'created_at', 'author_name']
+        fields = ['id', 'title', 'content', 'image', 'image_variants', 'tags', 'category', 'is_published', 'created_at', 'author_name', 'likes_count', 'comment_count', 'comments']
+        read_only_fields = ['likes_count']  # Maintained by accounts.likes
 
     def get_author_name(self, obj):
         return obj.author.email if obj.author else "Unknown"  # Change this if you want to use `name`
 
+    def get_image_variants(self, obj):
+        """Resized WebP/JPEG URLs per size; empty until the variants are built."""
+        return variant_urls(obj.image_variants, self.context.get('request'))
+
+    def get_comment_count(self, obj):
+        # Annotated by BlogPostViewSet; count directly for freshly saved posts
+        count = getattr(obj, 'comment_count', None)
+        return obj.comments.count() if count is None else count
+
+    def get_comments(self, obj):
+        """Latest comments, oldest first (prefetched by BlogPostViewSet)."""
+        comments = getattr(obj, 'latest_comments', None)
+        if comments is None:
+            limit = self.context.get('comment_limit', 3)
+            if not limit:
+                return []
+            comments = reversed(obj.comments.select_related('user').order_by('-created_at', '-id')[:limit])
+        return CommentSerializer(comments, many=True).data
+
+class TagSerializer(serializers.ModelSerializer):
+    post_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = Tag
+        fields = ['id', 'name', 'post_count']
+
 class LikeSerializer(serializers.ModelSerializer):
     class Meta:
         model = Like
@@ -64,9 +95,20 @@ from .models import FriendRequest, BlockedUser
 User = get_user_model()
 
 class UserSerializer(serializers.ModelSerializer):
+    profile_picture_variants = serializers.SerializerMethodField()
+
     class Meta:
         model = User
-        fields = ['id', 'email', 'first_name', 'last_name']
+        fields = ['id', 'email', 'first_name', 'last_name', 'profile_picture_variants']
+
+    def get_profile_picture_variants(self, obj):
+        return variant_urls(obj.profile_picture_variants, self.context.get('request'))
+
+
+class FriendSuggestionSerializer(serializers.Serializer):
+    """A suggested user's card plus how many friends they share with the viewer."""
+    user = UserSerializer(source='candidate')
+    mutual_friends = serializers.IntegerField(source='mutual_count')
 
 from rest_framework import serializers
 from .models import FriendRequest
@@ -114,3 +156,102 @@ class FriendshipSerializer(serializers.ModelSerializer):
         model = Friendship
         fields = ['id', 'user1', 'user2', 'created_at']
  
+
+
+from django.db import transaction
+from .models import Itinerary, ItineraryItem
+
+
+class ItineraryItemSerializer(serializers.ModelSerializer):
+    # Writable so an itinerary update can say which stored item each entry is
+    id = serializers.IntegerField(required=False)
+
+    class Meta:
+        model = ItineraryItem
+        fields = ['id', 'date', 'time', 'location', 'activity', 'notes']
+        extra_kwargs = {'time': {'required': False}}
+
+    def to_internal_value(self, data):
+        # The itinerary form sends "" for "no time"
+        if isinstance(data, dict) and data.get('time') == '':
+            data = {**data, 'time': None}
+        return super().to_internal_value(data)
+
+    def update(self, instance, validated_data):
+        validated_data.pop('id', None)
+        changed = apply_changes(instance, validated_data)
+        if changed:
+            instance.save(update_fields=changed)
+        return instance
+
+
+def apply_changes(instance, values):
+    """Set ``values`` on ``instance``; returns the names of fields that actually changed."""
+    changed = []
+    for field, value in values.items():
+        if getattr(instance, field) != value:
+            setattr(instance, field, value)
+            changed.append(field)
+    return changed
+
+
+class ItinerarySerializer(serializers.ModelSerializer):
+    items = ItineraryItemSerializer(many=True, required=False)
+    created_at = serializers.DateTimeField(format="%Y-%m-%d %H:%M", read_only=True)
+
+    class Meta:
+        model = Itinerary
+        fields = ['id', 'title', 'created_at', 'items']
+
+    def create(self, validated_data):
+        # Every item is already validated; write the itinerary and all of
+        # its items together or not at all
+        items = validated_data.pop('items', [])
+        with transaction.atomic():
+            itinerary = Itinerary.objects.create(**validated_data)
+            ItineraryItem.objects.bulk_create(
+                [ItineraryItem(itinerary=itinerary, **self._without_id(item)) for item in items],
+                batch_size=500,
+            )
+        return itinerary
+
+    def update(self, instance, validated_data):
+        """
+        Diff ``items`` against the stored ones by id: changed items are
+        bulk-updated, entries without a (known) id are inserted and stored
+        items missing from the list are deleted.  Unchanged items are not
+        written at all and keep their ids.
+        """
+        items = validated_data.pop('items', None)
+        with transaction.atomic():
+            changed = apply_changes(instance, validated_data)
+            if items is not None and self._save_items(instance, items):
+                changed.append('updated_at')
+            if changed:
+                instance.save(update_fields={*changed, 'updated_at'})
+        return instance
+
+    def _save_items(self, itinerary, items):
+        stored = {item.id: item for item in itinerary.items.all()}
+        updated, created, fields = [], [], set()
+        for data in items:
+            item = stored.pop(data.get('id'), None)
+            if item is None:
+                created.append(ItineraryItem(itinerary=itinerary, **self._without_id(data)))
+                continue
+            changed = apply_changes(item, self._without_id(data))
+            if changed:
+                updated.append(item)
+                fields.update(changed)
+
+        if stored:
+            ItineraryItem.objects.filter(id__in=list(stored)).delete()
+        if updated:
+            ItineraryItem.objects.bulk_update(updated, sorted(fields), batch_size=500)
+        if created:
+            ItineraryItem.objects.bulk_create(created, batch_size=500)
+        return bool(stored or updated or created)
+
+    @staticmethod
+    def _without_id(item):
+        return {field: value for field, value in item.items() if field != 'id'}
@@ -0,0 +1,137 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from . import blocks, friends, images, search, suggestions, timeline
+from .authentication import token_cache
+from .cache import CATEGORIES, TAGS, blog_cache, invalidate_posts
+from .models import BlockedUser, BlogPost, Category, Comment, Friendship, Like
+from .tags import sync_post_tags
+
+
+# ---------------------------
+# Blog cache invalidation
+# ---------------------------
+@receiver([post_save, post_delete], sender=BlogPost)
+def invalidate_blog_post(sender, instance, **kwargs):
+    invalidate_posts([instance.pk])
+
+
+@receiver([post_save, post_delete], sender=Comment)
+def invalidate_post_comments(sender, instance, **kwargs):
+    # The feed embeds comment counts and the latest comments
+    invalidate_posts([instance.post_id])
+
+
+@receiver([post_save, post_delete], sender=Like)
+def invalidate_post_likes(sender, instance, **kwargs):
+    invalidate_posts([instance.post_id], feed=False)
+
+
+@receiver([post_save, post_delete], sender=Category)
+def invalidate_categories(sender, instance, **kwargs):
+    blog_cache.bump(CATEGORIES)
+
+
+# ---------------------------
+# Full-text search index
+# ---------------------------
+@receiver(post_save, sender=BlogPost)
+def index_blog_post(sender, instance, **kwargs):
+    search.index_posts([instance])
+
+
+@receiver(post_delete, sender=BlogPost)
+def unindex_blog_post(sender, instance, **kwargs):
+    search.unindex_post(instance.pk)
+
+
+# ---------------------------
+# Normalised tag index
+# ---------------------------
+@receiver(post_save, sender=BlogPost)
+def sync_blog_post_tags(sender, instance, update_fields=None, **kwargs):
+    if update_fields is None or 'tags' in update_fields:
+        sync_post_tags(instance)
+
+
+@receiver(post_delete, sender=BlogPost)
+def invalidate_tag_cloud(sender, instance, **kwargs):
+    blog_cache.bump(TAGS)
+
+
+# ---------------------------
+# Image derivatives
+# ---------------------------
+@receiver(post_save, sender=BlogPost)
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def schedule_image_variants(sender, instance, raw=False, **kwargs):
+    image_field, variants_field = images.IMAGE_FIELDS[instance._meta.label]
+    if not raw and images.needs_variants(instance, image_field, variants_field):
+        images.schedule(instance)
+
+
+# ---------------------------
+# Cached friend-ID sets (registered before the timeline receivers, which read them)
+# ---------------------------
+@receiver([post_save, post_delete], sender=Friendship)
+def forget_friend_ids(sender, instance, **kwargs):
+    friends.forget_friends(instance.user1_id, instance.user2_id)
+
+
+# ---------------------------
+# Friends-first timelines
+# ---------------------------
+@receiver(post_save, sender=BlogPost)
+def fan_out_blog_post(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        timeline.fan_out_post(instance)
+
+
+@receiver(post_save, sender=Friendship)
+def backfill_friend_timelines(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        timeline.backfill_friendship(instance.user1_id, instance.user2_id)
+
+
+@receiver(post_delete, sender=Friendship)
+def prune_friend_timelines(sender, instance, **kwargs):
+    timeline.drop_friendship(instance.user1_id, instance.user2_id)
+
+
+# ---------------------------
+# Cached block sets
+# ---------------------------
+@receiver([post_save, post_delete], sender=BlockedUser)
+def forget_block_sets(sender, instance, **kwargs):
+    blocks.forget_blocks(instance.blocker_id, instance.blocked_id)
+
+
+# ---------------------------
+# Friend suggestions (mutual-friend counts)
+# ---------------------------
+@receiver(post_save, sender=Friendship)
+def count_new_mutual_friends(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        suggestions.add_friendship(instance.user1_id, instance.user2_id)
+
+
+@receiver(post_delete, sender=Friendship)
+def uncount_mutual_friends(sender, instance, **kwargs):
+    suggestions.remove_friendship(instance.user1_id, instance.user2_id)
+
+
+@receiver(pre_delete, sender=settings.AUTH_USER_MODEL)
+def uncount_deleted_user(sender, instance, **kwargs):
+    # The cascade removes their friendships before the signals above could
+    # see who they were friends with
+    suggestions.remove_user(instance.pk)
+
+
+# ---------------------------
+# Cached JWT users
+# ---------------------------
+@receiver([post_save, post_delete], sender=settings.AUTH_USER_MODEL)
+def invalidate_token_users(sender, instance, **kwargs):
+    # Covers change_password too, which saves the user
+    token_cache.invalidate_user(instance.pk)
@@ -0,0 +1,73 @@
+from django.db import models
+
+from .blocks import hidden_ids
+from .friends import friend_ids
+from .models import FriendRequest, FriendSuggestion
+
+
+def _bump(user_id, candidate_ids, delta):
+    """Add ``delta`` to the mutual count of ``user_id`` with each candidate, both directions."""
+    candidate_ids = set(candidate_ids)
+    if not candidate_ids:
+        return
+    pairs = models.Q(user_id=user_id, candidate_id__in=candidate_ids) | models.Q(user_id__in=candidate_ids, candidate_id=user_id)
+    rows = FriendSuggestion.objects.filter(pairs)
+
+    if delta < 0:
+        rows.update(mutual_count=models.F('mutual_count') + delta)
+        FriendSuggestion.objects.filter(pairs, mutual_count__lte=0).delete()
+        return
+
+    existing = set(rows.values_list('user_id', 'candidate_id'))
+    rows.update(mutual_count=models.F('mutual_count') + delta)
+    wanted = {(user_id, c) for c in candidate_ids} | {(c, user_id) for c in candidate_ids}
+    FriendSuggestion.objects.bulk_create(
+        [FriendSuggestion(user_id=u, candidate_id=c, mutual_count=delta) for u, c in wanted - existing],
+        batch_size=500,
+    )
+
+
+def _adjust(user_a_id, user_b_id, delta):
+    # a is now (or no longer) a mutual friend of b and each of a's other
+    # friends, and the same the other way round
+    _bump(user_b_id, friend_ids(user_a_id) - {user_b_id}, delta)
+    _bump(user_a_id, friend_ids(user_b_id) - {user_a_id}, delta)
+
+
+def add_friendship(user_a_id, user_b_id):
+    _adjust(user_a_id, user_b_id, 1)
+
+
+def remove_friendship(user_a_id, user_b_id):
+    _adjust(user_a_id, user_b_id, -1)
+
+
+def remove_user(user_id):
+    """
+    Before a user is deleted: they stop being a mutual friend of every pair
+    of their friends.  (Their own rows go with the cascade.)
+    """
+    friends = sorted(friend_ids(user_id))
+    for i, friend in enumerate(friends):
+        _bump(friend, friends[i + 1:], -1)
+
+
+def ranked_suggestions(user):
+    """
+    FriendSuggestion rows for ``user``, best first, skipping friends,
+    pending requests either way and blocks either way.
+    """
+    pending = FriendRequest.objects.filter(status='pending')
+    return (
+        FriendSuggestion.objects.filter(user=user)
+        .exclude(candidate_id__in=friend_ids(user.pk) | hidden_ids(user.pk))
+        .exclude(candidate_id__in=pending.filter(sender=user).values('receiver_id'))
+        .exclude(candidate_id__in=pending.filter(receiver=user).values('sender_id'))
+        .exclude(candidate__is_superuser=True)
+        .order_by('-mutual_count', 'candidate_id')
+    )
+
+
+def suggestions_for(user, limit=20):
+    """The top ``limit`` of ``ranked_suggestions`` with ``candidate`` loaded."""
+    return ranked_suggestions(user).select_related('candidate')[:limit]
@@ -0,0 +1,44 @@
+from .cache import TAGS, blog_cache
+from .models import PostTag, Tag
+
+MAX_TAG_LENGTH = 50
+
+
+def split_tags(value):
+    """Split a comma-separated tags string into unique, normalised names."""
+    names = []
+    for raw in (value or '').split(','):
+        name = raw.strip().lstrip('#').strip().lower()[:MAX_TAG_LENGTH]
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def normalize_tag(value):
+    names = split_tags(value)
+    return names[0] if names else ''
+
+
+def get_or_create_tags(names):
+    """Return ``{name: tag}`` for ``names``, creating missing tags in one INSERT."""
+    tags = {tag.name: tag for tag in Tag.objects.filter(name__in=names)}
+    missing = [Tag(name=name) for name in names if name not in tags]
+    if missing:
+        Tag.objects.bulk_create(missing, ignore_conflicts=True)
+        tags.update({tag.name: tag for tag in Tag.objects.filter(name__in=[t.name for t in missing])})
+    return tags
+
+
+def sync_post_tags(post):
+    """Bring the PostTag rows for ``post`` in line with its ``tags`` string."""
+    wanted = {tag.id for tag in get_or_create_tags(split_tags(post.tags)).values()}
+    current = set(PostTag.objects.filter(post=post).values_list('tag_id', flat=True))
+
+    removed = current - wanted
+    added = wanted - current
+    if removed:
+        PostTag.objects.filter(post=post, tag_id__in=removed).delete()
+    if added:
+        PostTag.objects.bulk_create([PostTag(post=post, tag_id=tag_id) for tag_id in added], ignore_conflicts=True)
+    if removed or added:
+        blog_cache.bump(TAGS)
@@ -1,3 +1,180 @@
-from django.test import TestCase
+import io
+import json
+import shutil
+import tempfile
+from collections import Counter
+from itertools import combinations
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from PIL import Image
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from . import images
+from .blocks import block_cache
+
+from .friend_requests import accept_requests
+from .friends import befriend, forget_friends, friend_cache, friend_ids
+from .models import BlogPost, FriendRequest, FriendSuggestion, Itinerary
+
+User = get_user_model()
+
+
+def make_user(name):
+    return User.objects.create(email=f"{name.lower()}@example.com", first_name=name)
+
+
+class CacheIsolationMixin:
+    """The in-process friend and block caches outlive each test's rollback."""
+
+    def setUp(self):
+        super().setUp()
+        friend_cache.backend.clear()
+        block_cache.backend.clear()
+
+
+class FriendSuggestionCountTests(CacheIsolationMixin, TestCase):
+    def expected_counts(self):
+        """Mutual-friend counts recomputed from scratch, as migration 0019 does."""
+        users = list(User.objects.values_list('id', flat=True))
+        forget_friends(*users)
+        mutual = Counter()
+        for user_id in users:
+            for a, b in combinations(sorted(friend_ids(user_id)), 2):
+                mutual[a, b] += 1
+                mutual[b, a] += 1
+        return dict(mutual)
+
+    def stored_counts(self):
+        return {(s.user_id, s.candidate_id): s.mutual_count for s in FriendSuggestion.objects.all()}
+
+    def test_bulk_accept_matches_full_recompute(self):
+        receiver = make_user("Receiver")
+        senders = [make_user(f"Sender{i}") for i in range(3)]
+        common = make_user("Common")
+        befriend(senders[0].pk, common.pk)
+        befriend(receiver.pk, common.pk)
+        requests = [FriendRequest.objects.create(sender=sender, receiver=receiver) for sender in senders]
+
+        report = accept_requests(receiver, [r.id for r in requests])
+
+        self.assertEqual(report['done'], sorted(r.id for r in requests))
+        self.assertEqual(self.stored_counts(), self.expected_counts())
+        self.assertEqual(
+            FriendSuggestion.objects.get(user=senders[1], candidate=senders[2]).mutual_count, 1
+        )
+
+
+def image_upload(name, color):
+    buffer = io.BytesIO()
+    Image.new('RGB', (800, 600), color).save(buffer, 'PNG' if name.endswith('.png') else 'JPEG')
+    return SimpleUploadedFile(name, buffer.getvalue())
+
+
+class ImageVariantTests(CacheIsolationMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.author = make_user("Author")
+
+    def make_post(self, upload):
+        post = BlogPost.objects.create(author=self.author, title="Trip", content="...", tags="", image=upload)
+        images.process_instance('accounts.BlogPost', post.pk)
+        post.refresh_from_db()
+        return post
+
+    def variant_paths(self, post):
+        return {path for variant in images.VARIANTS for path in post.image_variants[variant].values()}
+
+    def test_reupload_keeps_new_variants(self):
+        post = self.make_post(image_upload('a.png', 'red'))
+        old_paths = self.variant_paths(post)
+
+        post.image = image_upload('a.jpg', 'blue')
+        post.save()
+        images.process_instance('accounts.BlogPost', post.pk)
+        post.refresh_from_db()
+
+        new_paths = self.variant_paths(post)
+        self.assertEqual(post.image_variants['source'], post.image.name)
+        self.assertTrue(new_paths.isdisjoint(old_paths))
+        self.assertTrue(all(default_storage.exists(path) for path in new_paths))
+        self.assertFalse(any(default_storage.exists(path) for path in old_paths))
+
+    def test_same_stem_on_two_posts_does_not_collide(self):
+        first = self.make_post(image_upload('a.png', 'red'))
+        second = self.make_post(image_upload('a.jpg', 'blue'))
+
+        self.assertTrue(self.variant_paths(first).isdisjoint(self.variant_paths(second)))
+        self.assertTrue(all(default_storage.exists(path) for path in self.variant_paths(first)))
+
+
+class UserDirectorySearchTests(CacheIsolationMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.viewer = make_user("Viewer")
+        self.client = APIClient()
+        self.client.force_authenticate(self.viewer)
+
+    def search(self, query):
+        response = self.client.get("/api/users/", {"q": query}, HTTP_HOST="localhost")
+        self.assertEqual(response.status_code, 200)
+        return sorted(user["first_name"] for user in response.json())
+
+    def test_non_ascii_prefix(self):
+        make_user("Élodie")
+        make_user("Elliot")
+
+        self.assertEqual(self.search("élo"), ["Élodie"])
+        self.assertEqual(self.search("ÉLO"), ["Élodie"])
+        self.assertEqual(self.search("el"), ["Elliot"])
+
+    def test_rename_with_update_fields(self):
+        user = make_user("Bob")
+        user.first_name = "Øystein"
+        user.save(update_fields=["first_name"])
+
+        self.assertEqual(self.search("øy"), ["Øystein"])
+        user.refresh_from_db()
+        self.assertEqual(user.search_first_name, "øystein")
+
+
+class CreateItineraryTests(CacheIsolationMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        user = make_user("Traveler")
+        self.auth = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(user)}"}
+
+    def post(self, payload):
+        return self.client.post(
+            "/api/itinerary/", json.dumps(payload), content_type="application/json", HTTP_HOST="localhost", **self.auth
+        )
+
+    def test_invalid_item_is_reported_by_position(self):
+        response = self.post({"title": "Trip", "items": [
+            {"date": "2025-01-01", "location": "Paris"},
+            {"date": "not a date", "location": "Lyon"},
+        ]})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(response.json()["error"].startswith("Item 2, date: "))
+        self.assertFalse(Itinerary.objects.exists())
+
+    def test_missing_title(self):
+        response = self.post({"items": []})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["error"], "title: This field is required.")
+
+    def test_items_not_a_list(self):
+        response = self.post({"title": "Trip", "items": "Paris"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(response.json()["error"].startswith("items: Expected a list"))
@@ -0,0 +1,99 @@
+from django.conf import settings
+from django.db import models
+
+from .friends import friend_ids
+from .models import BlogPost, Friendship, TimelineEntry
+from .pagination import KeysetPagination
+
+# Authors with more friends than this don't fan out; their friends pull
+# their posts at read time instead, so one post never writes thousands of rows.
+FANOUT_LIMIT = getattr(settings, 'TIMELINE_FANOUT_LIMIT', 500)
+
+# How many recent posts each side gets when two users become friends
+BACKFILL_POSTS = getattr(settings, 'TIMELINE_BACKFILL_POSTS', 50)
+
+
+def friend_counts(user_ids):
+    counts = dict.fromkeys(user_ids, 0)
+    for side in ('user1', 'user2'):
+        rows = (
+            Friendship.objects.filter(**{f'{side}_id__in': user_ids})
+            .values(side)
+            .annotate(total=models.Count('id'))
+            .values_list(side, 'total')
+        )
+        for user_id, total in rows:
+            counts[user_id] += total
+    return counts
+
+
+def pulled_authors(user_id):
+    """Friends of ``user_id`` whose posts are fanned out on read."""
+    friends = friend_ids(user_id)
+    if not friends:
+        return set()
+    return {friend for friend, count in friend_counts(friends).items() if count > FANOUT_LIMIT}
+
+
+def fan_out_post(post):
+    """Write ``post`` into its author's timeline and every friend's."""
+    readers = set(friend_ids(post.author_id))
+    if len(readers) > FANOUT_LIMIT:
+        readers = set()
+    readers.add(post.author_id)
+    TimelineEntry.objects.bulk_create(
+        [TimelineEntry(user_id=reader, post=post, created_at=post.created_at) for reader in readers],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+def backfill_friendship(user_a_id, user_b_id):
+    """Give two new friends each other's recent posts."""
+    for reader, author in ((user_a_id, user_b_id), (user_b_id, user_a_id)):
+        if len(friend_ids(author)) > FANOUT_LIMIT:
+            continue
+        recent = BlogPost.objects.filter(author_id=author).order_by('-created_at', '-id').values_list('id', 'created_at')[:BACKFILL_POSTS]
+        TimelineEntry.objects.bulk_create(
+            [TimelineEntry(user_id=reader, post_id=post_id, created_at=created_at) for post_id, created_at in recent],
+            ignore_conflicts=True,
+        )
+
+
+def drop_friendship(user_a_id, user_b_id):
+    TimelineEntry.objects.filter(
+        models.Q(user_id=user_a_id, post__author_id=user_b_id)
+        | models.Q(user_id=user_b_id, post__author_id=user_a_id)
+    ).delete()
+
+
+class TimelinePagination(KeysetPagination):
+    """
+    Keyset pagination over a user's timeline.
+
+    Pages are (created_at, post_id) keys merged from the user's TimelineEntry
+    rows and, for high-degree friends, straight from BlogPost.  Both sources
+    are read through the same seek so one cursor works for the merged stream.
+    """
+
+    def is_requested(self, request):
+        return True
+
+    def get_position(self, key):
+        return key
+
+    def paginate_timeline(self, request, user):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.reverse, position = self.decode_cursor(request)
+        limit = self.page_size + 1
+
+        entries = self.seek(TimelineEntry.objects.filter(user=user), position, self.reverse, 'post_id')
+        keys = list(entries.values_list('created_at', 'post_id')[:limit])
+
+        authors = pulled_authors(user.pk)
+        if authors:
+            pulled = self.seek(BlogPost.objects.filter(author_id__in=authors), position, self.reverse)
+            keys = sorted(set(keys) | set(pulled.values_list('created_at', 'id')[:limit]), reverse=not self.reverse)
+
+        return self.paginate_results(keys[:limit], position)
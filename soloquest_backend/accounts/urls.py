@@ -2,7 +2,7 @@ from django.urls import path
 from . import views
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import BlogPostViewSet, CommentViewSet, CategoryViewSet
+from .views import BlogPostViewSet, CommentViewSet, CategoryViewSet, TagViewSet
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import BlogPostViewSet, LikePostView, CommentPostView
@@ -17,10 +17,24 @@ from .views import update_itinerary
 from django.urls import path
 from .views import accept_friend_request, delete_friend_request
 
+from django.conf import settings
+from . import async_views
+
+# Under ASGI the password-hashing views are served by their async variants
+if settings.ASYNC_AUTH_VIEWS:
+    register_view = async_views.register
+    signin_view = async_views.signin
+    change_password_view = async_views.change_password
+else:
+    register_view = views.RegisterView.as_view()
+    signin_view = views.SignInView.as_view()
+    change_password_view = views.change_password
+
 router = DefaultRouter()
 router.register(r'posts', BlogPostViewSet)
 router.register(r'comments', CommentViewSet)
 router.register(r'categories', CategoryViewSet) 
+router.register(r'tags', TagViewSet, basename="tags")
 router.register(r'posts', BlogPostViewSet, basename="posts")
 router.register(r'users', UserViewSet, basename="user")
 router.register(r'users', UserViewSet, basename="users")
@@ -31,14 +45,15 @@ router.register(r'blocked-users', BlockedUserViewSet, basename="blocked-users")
 
 
 urlpatterns = [
-    path('register/', views.RegisterView.as_view(), name='register'),
+    path('register/', register_view, name='register'),
     path('destination-favorites/', views.get_destination_favorites, name='destination_favorites'),
     path('favorites/add/', views.add_favorite, name='add_favorite'),
     path('favorites/remove/<str:country_code>/', views.remove_favorite, name='remove_favorite'),
     path('api/signup/', views.SignUpView.as_view(), name='api-signup'),
-    path('api/signin/', views.SignInView.as_view(), name='api-signin'),
+    path('api/signin/', signin_view, name='api-signin'),
     path('api/get-csrf-token/', views.get_csrf_token, name='get-csrf-token'),
-    path("change-password/", views.change_password, name="change_password"),
+    path('api/cache-stats/', views.cache_stats, name='cache-stats'),
+    path("change-password/", change_password_view, name="change_password"),
     path('favorite-destinations/<int:destination_id>/toggle/', views.toggle_favorite_destination, name='toggle_favorite_destination'),
     path('', include(router.urls)),
     path('posts/<int:post_id>/like/', LikePostView.as_view(), name="like-post"),
@@ -52,9 +67,11 @@ urlpatterns = [
     path("api/delete-itinerary/<int:id>/", views.delete_itinerary, name="delete_itinerary"),
     path('comments/<int:comment_id>/', CommentDetailView.as_view(), name='comment-detail'),
     path("api/update-itinerary/<int:id>/", update_itinerary, name="update-itinerary"),
+    path("api/itinerary-items/<int:id>/", views.update_itinerary_item, name="update-itinerary-item"),
     path("api/accept-friend-request/<int:request_id>/", accept_friend_request, name="accept-friend-request"),
+    path("api/connect/bootstrap/", views.connect_bootstrap, name="connect-bootstrap"),
     path("api/delete-friend-request/<int:request_id>/", delete_friend_request, name="delete-friend-request"),
-    path('api/change-password/', views.change_password, name='change_password'),
+    path('api/change-password/', change_password_view, name='change_password'),
     path('accept-friend-request/<int:request_id>/', views.accept_friend_request),
 
 
@@ -1,7 +1,7 @@
 from django.contrib.auth import authenticate
 from rest_framework import generics, status
-from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -13,8 +13,8 @@ from django.middleware.csrf import get_token
 from django.views.decorators.csrf import ensure_csrf_cookie
 from django.shortcuts import get_object_or_404
 from rest_framework import viewsets
-from .models import Category
-from .serializers import CategorySerializer
+from .models import Category, Tag
+from .serializers import CategorySerializer, TagSerializer
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.decorators import action
 from .models import BlogPost, Comment, Like
@@ -22,7 +22,23 @@ from .serializers import BlogPostSerializer, CommentSerializer
 from rest_framework.permissions import AllowAny
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from .serializers import BlogPostSerializer
+from .pagination import KeysetPagination
+from .likes import record_like, remove_like
+from .cache import CATEGORIES, FEED, blog_cache, cached_response, feed_key, post_key, post_version_name, tag_cloud_key
+from .conditional import conditional_response
+from .tags import normalize_tag
+from .search import search_posts
+from .timeline import TimelinePagination
+from .authentication import get_user_from_token, token_cache
+from .ratelimit import rate_limited
+from .friends import CARD_FIELDS, are_friends, befriend, card_values, friend_cache, friend_ids, friendship_between, user_cards
+from .directory import UserDirectoryPagination, search_users
+from .blocks import block_cache, hidden_for, hidden_variant, is_blocked
+from . import friend_requests
+from rest_framework.exceptions import Throttled, ValidationError
+from django.utils.cache import patch_vary_headers
 from django.db import models
+from django.db.models.functions import Coalesce, RowNumber
 
 
 
@@ -46,7 +62,8 @@ def change_password(request):
         return Response({'error': 'Current password is incorrect.'}, status=400)
 
     user.set_password(data['new_password'])
-    user.save()
+    # request.user may be a cached snapshot; write only the password back
+    user.save(update_fields=['password'])
     return Response({'message': 'Password changed successfully.'})
 
 class SignUpView(generics.CreateAPIView):
@@ -54,6 +71,8 @@ class SignUpView(generics.CreateAPIView):
     permission_classes = [AllowAny]
 
 class SignInView(APIView):
+    throttle_classes = [rate_limited('signin')]
+
     def post(self, request):
         email = request.data.get('email')
         password = request.data.get('password')
@@ -77,6 +96,19 @@ class SignInView(APIView):
             })
         return Response({'error': 'Invalid Credentials'}, status=status.HTTP_401_UNAUTHORIZED)
 
+# ---------------------------
+# ✅ Cache metrics (staff only)
+# ---------------------------
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def cache_stats(request):
+    return Response({
+        'blog': blog_cache.stats(),
+        'jwt_users': token_cache.stats(),
+        'friend_ids': friend_cache.stats(),
+        'block_sets': block_cache.stats(),
+    })
+
 # ---------------------------
 # ✅ Favorites Endpoints (Country Codes)
 # ---------------------------
@@ -84,8 +116,13 @@ class SignInView(APIView):
 @permission_classes([IsAuthenticated])
 def get_country_favorites(request):
     favorites = Favorite.objects.filter(user=request.user)
-    data = [{"country_code": fav.country_code} for fav in favorites]
-    return Response(data)
+    stamp = favorites.aggregate(count=models.Count('id'), latest=models.Max('added_at'))
+
+    def build():
+        data = [{"country_code": fav.country_code} for fav in favorites]
+        return Response(data)
+
+    return conditional_response(request, build, [request.user.pk, stamp['count'], stamp['latest']], stamp['latest'])
 
 
 @api_view(['POST'])
@@ -129,6 +166,8 @@ def toggle_favorite_destination(request, destination_id): #modified to be an api
 # ✅ User Registration API (Sign-Up)
 # ---------------------------
 class RegisterView(APIView):
+    throttle_classes = [rate_limited('register')]
+
     def post(self, request):
         email = request.data.get("email")
         password = request.data.get("password")
@@ -143,7 +182,6 @@ class RegisterView(APIView):
             return Response({"error": "Email already exists."}, status=status.HTTP_400_BAD_REQUEST)
 
         user = CustomUser(
-            username=email,
             email=email,
             first_name=first_name,
             last_name=last_name,
@@ -167,12 +205,12 @@ class RegisterView(APIView):
 
 
 @api_view(['POST'])
+@permission_classes([IsAuthenticated])
 def like_post(request, post_id):
     try:
         post = BlogPost.objects.get(id=post_id)
-        post.likes_count += 1  # Increment the like count
-        post.save()
-        return Response({'likes_count': post.likes_count}, status=200)
+        _, likes_count = record_like(post, request.user)
+        return Response({'likes_count': likes_count}, status=200)
     except BlogPost.DoesNotExist:
         return Response({'error': 'Post not found'}, status=404)
 
@@ -194,10 +232,126 @@ def add_comment(request, post_id):
         return Response({'error': 'Post not found'}, status=404)
 
 
+def comment_count_subquery(hidden=()):
+    """Per-post comment count as a correlated subquery (no GROUP BY over the feed joins)."""
+    counts = (
+        Comment.objects.filter(post=models.OuterRef('pk'))
+        .exclude(user_id__in=hidden)
+        .order_by()
+        .values('post')
+        .annotate(total=models.Count('pk'))
+        .values('total')
+    )
+    return Coalesce(models.Subquery(counts, output_field=models.IntegerField()), 0)
+
+
+def latest_comments_prefetch(limit, hidden=()):
+    """
+    Prefetch the newest ``limit`` comments of every post in one query, using
+    ROW_NUMBER() partitioned by post so the page size doesn't matter.
+    """
+    row_number = models.Window(
+        RowNumber(),
+        partition_by=[models.F('post_id')],
+        order_by=[models.F('created_at').desc(), models.F('id').desc()],
+    )
+    comments = (
+        Comment.objects.select_related('user')
+        .exclude(user_id__in=hidden)
+        .annotate(row_number=row_number)
+        .filter(row_number__lte=limit)
+        .order_by('created_at', 'id')
+    )
+    return models.Prefetch('comments', queryset=comments, to_attr='latest_comments')
+
+
 class BlogPostViewSet(viewsets.ModelViewSet):
-    queryset = BlogPost.objects.all()
+    queryset = BlogPost.objects.select_related('author', 'category')
     serializer_class = BlogPostSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]  # Allow read without authentication
+    pagination_class = KeysetPagination  # Opt-in with ?cursor= or ?page_size=
+    comment_limit = 3  # Latest comments embedded per post; override with ?comments=
+    max_comment_limit = 20
+
+    def get_comment_limit(self):
+        try:
+            limit = int(self.request.query_params.get('comments', self.comment_limit))
+        except ValueError:
+            return self.comment_limit
+        return min(max(limit, 0), self.max_comment_limit)
+
+    def get_hidden_users(self):
+        # Authors and commenters the viewer blocked or was blocked by
+        if not hasattr(self, '_hidden_users'):
+            self._hidden_users = hidden_for(self.request)
+        return self._hidden_users
+
+    def get_queryset(self):
+        hidden = self.get_hidden_users()
+        queryset = super().get_queryset().exclude(author_id__in=hidden).annotate(comment_count=comment_count_subquery(hidden))
+        limit = self.get_comment_limit()
+        if limit:
+            queryset = queryset.prefetch_related(latest_comments_prefetch(limit, hidden))
+        tag = normalize_tag(self.request.query_params.get('tag', ''))
+        if tag:
+            queryset = queryset.filter(post_tags__tag__name=tag)
+        return queryset
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['comment_limit'] = self.get_comment_limit()
+        return context
+
+    def list(self, request, *args, **kwargs):
+        # Viewers with blocks get their own cached copy of the feed
+        variant = hidden_variant(self.get_hidden_users())
+
+        def build():
+            return cached_response(blog_cache, feed_key(request, variant), lambda: super(BlogPostViewSet, self).list(request, *args, **kwargs))
+
+        response = conditional_response(request, build, [blog_cache.version(FEED), variant], private=bool(variant))
+        patch_vary_headers(response, ['Authorization'])
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        post_id = kwargs[self.lookup_url_kwarg or self.lookup_field]
+        variant = hidden_variant(self.get_hidden_users())
+
+        def build():
+            key = post_key(request, post_id, variant)
+            return cached_response(blog_cache, key, lambda: super(BlogPostViewSet, self).retrieve(request, *args, **kwargs))
+
+        response = conditional_response(request, build, [blog_cache.version(post_version_name(post_id)), variant], private=bool(variant))
+        patch_vary_headers(response, ['Authorization'])
+        return response
+
+    # ✅ Full-text search: /posts/search/?q=
+    @action(detail=False, methods=['GET'])
+    def search(self, request):
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response({"error": "Query parameter 'q' is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            limit = min(max(int(request.query_params.get('limit', 20)), 1), 100)
+        except ValueError:
+            limit = 20
+
+        hits = search_posts(self.get_queryset(), query, limit)
+        data = self.get_serializer([post for post, _, _ in hits], many=True).data
+        for item, (_, rank, snippet) in zip(data, hits):
+            item['rank'] = rank
+            item['snippet'] = snippet
+        return Response(data)
+
+    # ✅ Friends-first timeline: your posts and your friends' posts, newest first
+    @action(detail=False, methods=['GET'], permission_classes=[IsAuthenticated])
+    def timeline(self, request):
+        paginator = TimelinePagination()
+        keys = paginator.paginate_timeline(request, request.user)
+        posts = self.get_queryset().in_bulk([post_id for _, post_id in keys])
+        data = self.get_serializer([posts[post_id] for _, post_id in keys if post_id in posts], many=True).data
+        return paginator.get_paginated_response(data)
 
     def perform_create(self, serializer):
         """ Assign the currently authenticated user as the author """
@@ -205,16 +359,51 @@ class BlogPostViewSet(viewsets.ModelViewSet):
 
 
 class CommentViewSet(viewsets.ModelViewSet):
-    queryset = Comment.objects.all().order_by('-created_at')
+    queryset = Comment.objects.select_related('user').order_by('-created_at')
     serializer_class = CommentSerializer
     permission_classes = [IsAuthenticated]
 
+    def get_queryset(self):
+        queryset = super().get_queryset().exclude(user_id__in=hidden_for(self.request))
+        post_id = self.request.query_params.get('post')
+        if post_id and post_id.isdigit():
+            queryset = queryset.filter(post_id=post_id)
+        return queryset
+
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
 class CategoryViewSet(viewsets.ModelViewSet):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
+
+    def list(self, request, *args, **kwargs):
+        build = lambda: super(CategoryViewSet, self).list(request, *args, **kwargs)
+        return conditional_response(request, build, [blog_cache.version(CATEGORIES)], private=False)
+
+    def retrieve(self, request, *args, **kwargs):
+        build = lambda: super(CategoryViewSet, self).retrieve(request, *args, **kwargs)
+        return conditional_response(request, build, [blog_cache.version(CATEGORIES)], private=False)
+
+
+# ✅ Tag cloud: every tag in use with its post count, most used first
+class TagViewSet(viewsets.ReadOnlyModelViewSet):
+    queryset = Tag.objects.annotate(post_count=models.Count('post_tags')).filter(post_count__gt=0).order_by('-post_count', 'name')
+    serializer_class = TagSerializer
+    permission_classes = [AllowAny]
+
+    def list(self, request, *args, **kwargs):
+        return cached_response(blog_cache, tag_cloud_key(request), lambda: self._tag_cloud(request))
+
+    def _tag_cloud(self, request):
+        queryset = self.get_queryset()
+        try:
+            limit = int(request.query_params.get('limit', 0))
+        except ValueError:
+            limit = 0
+        if limit > 0:
+            queryset = queryset[:limit]
+        return Response(self.get_serializer(queryset, many=True).data)
     
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -223,16 +412,25 @@ from django.shortcuts import get_object_or_404
 from .models import BlogPost
 
 class LikePostView(APIView):
+    permission_classes = [IsAuthenticated]  # Likes are recorded per user
+    throttle_classes = [rate_limited('like')]
+
     def post(self, request, post_id):
         post = get_object_or_404(BlogPost, id=post_id)
-        post.likes_count += 1
-        post.save()
-        return Response({'likes_count': post.likes_count}, status=status.HTTP_200_OK)
+        _, likes_count = record_like(post, request.user)
+        return Response({'likes_count': likes_count}, status=status.HTTP_200_OK)
+
+    def delete(self, request, post_id):
+        post = get_object_or_404(BlogPost, id=post_id)
+        _, likes_count = remove_like(post, request.user)
+        return Response({'likes_count': likes_count}, status=status.HTTP_200_OK)
     
 from .models import Comment
 from .serializers import CommentSerializer
 
 class CommentPostView(APIView):
+    throttle_classes = [rate_limited('comment')]
+
     def post(self, request, post_id):
         post = get_object_or_404(BlogPost, id=post_id)
         serializer = CommentSerializer(data=request.data)
@@ -301,10 +499,12 @@ from django.contrib.auth import get_user_model
 from django.shortcuts import get_object_or_404
 from django.db import models  
 from .models import FriendRequest, Friendship, BlockedUser
-from .serializers import FriendRequestSerializer, FriendshipSerializer, BlockedUserSerializer, UserSerializer
+from .serializers import FriendRequestSerializer, FriendshipSerializer, BlockedUserSerializer, UserSerializer, FriendSuggestionSerializer
+from .suggestions import suggestions_for
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
+@throttle_classes([rate_limited('friend_request')])
 def send_friend_request(request, user_id):
     sender = request.user  # ✅ Get logged-in user (the sender)
     receiver = get_object_or_404(CustomUser, id=user_id)  # ✅ Get recipient
@@ -312,6 +512,9 @@ def send_friend_request(request, user_id):
     if sender.id == receiver.id:
         return Response({"error": "You cannot send a request to yourself."}, status=400)
 
+    if is_blocked(sender.id, receiver.id):
+        return Response({"error": "You cannot send a friend request to this user."}, status=403)
+
     if FriendRequest.objects.filter(sender=sender, receiver=receiver, status="pending").exists():
         return Response({"error": "Friend request already sent."}, status=400)
 
@@ -344,9 +547,19 @@ class UserViewSet(viewsets.ModelViewSet):
     queryset = User.objects.all().exclude(is_superuser=True)  # Exclude admin users
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = UserDirectoryPagination  # Opt-in via ?cursor= / ?page_size=
+
+    def get_queryset(self):
+        queryset = super().get_queryset().exclude(id__in=hidden_for(self.request))
+        if self.action != 'list':
+            return queryset
+        # ✅ Directory listing: ?q= prefix search, only the columns a user card shows
+        # (plus date_joined, which the keyset cursors are built from)
+        query = self.request.query_params.get('q', '').strip()
+        return search_users(queryset, query).only(*CARD_FIELDS, 'date_joined').order_by('-date_joined', '-id')
 
     # ✅ Send Friend Request
-    @action(detail=True, methods=['POST'])
+    @action(detail=True, methods=['POST'], throttle_classes=[rate_limited('friend_request')])
     def send_friend_request(self, request, pk=None):
         receiver = get_object_or_404(User, id=pk)
         sender = request.user
@@ -354,6 +567,9 @@ class UserViewSet(viewsets.ModelViewSet):
         if sender == receiver:
             return Response({"error": "You cannot send a request to yourself."}, status=status.HTTP_400_BAD_REQUEST)
 
+        if is_blocked(sender.pk, receiver.pk):
+            return Response({"error": "You cannot send a friend request to this user."}, status=status.HTTP_403_FORBIDDEN)
+
         if FriendRequest.objects.filter(sender=sender, receiver=receiver, status="pending").exists():
             return Response({"error": "Friend request already sent."}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -368,7 +584,7 @@ class UserViewSet(viewsets.ModelViewSet):
         friend_request.save()
 
         # Create a Friendship entry
-        Friendship.objects.create(user1=friend_request.sender, user2=friend_request.receiver)
+        befriend(friend_request.sender_id, friend_request.receiver_id)
 
         return Response({"message": "Friend request accepted."}, status=status.HTTP_200_OK)
 
@@ -386,14 +602,11 @@ class UserViewSet(viewsets.ModelViewSet):
         sender = request.user
         receiver = get_object_or_404(User, id=pk)
 
-        friendship = Friendship.objects.filter(
-            models.Q(user1=sender, user2=receiver) | models.Q(user1=receiver, user2=sender)
-        )
-        
-        if friendship.exists():
-            friendship.delete()
-            return Response({"message": "Friend removed successfully."}, status=status.HTTP_200_OK)
-        return Response({"error": "You are not friends."}, status=status.HTTP_400_BAD_REQUEST)
+        if not are_friends(sender.pk, receiver.pk):
+            return Response({"error": "You are not friends."}, status=status.HTTP_400_BAD_REQUEST)
+
+        friendship_between(sender.pk, receiver.pk).delete()
+        return Response({"message": "Friend removed successfully."}, status=status.HTTP_200_OK)
 
     # ✅ Block User
     @action(detail=True, methods=['POST'])
@@ -416,13 +629,27 @@ class UserViewSet(viewsets.ModelViewSet):
         BlockedUser.objects.filter(blocker=blocker, blocked=blocked).delete()
         return Response({"message": "User unblocked successfully."}, status=status.HTTP_200_OK)
 
-    # ✅ Get List of Friends
+    # ✅ People you may know, ranked by mutual friends (precomputed, see accounts.suggestions)
+    @action(detail=False, methods=['GET'])
+    def suggestions(self, request):
+        try:
+            limit = max(1, min(int(request.query_params.get('limit', 20)), 100))
+        except ValueError:
+            limit = 20
+        rows = suggestions_for(request.user, limit)
+        return Response(FriendSuggestionSerializer(rows, many=True, context={'request': request}).data)
+
+    # ✅ Get List of Friends (cached friend-ID set + one in_bulk query)
     @action(detail=False, methods=['GET'])
     def my_friends(self, request):
         user = request.user
-        friendships = Friendship.objects.filter(models.Q(user1=user) | models.Q(user2=user))
-        friend_users = [fr.user2 if fr.user1 == user else fr.user1 for fr in friendships]
-        return Response(UserSerializer(friend_users, many=True).data)
+        ids = sorted(friend_ids(user.pk))
+
+        def build():
+            return Response(UserSerializer(user_cards(ids), many=True, context={'request': request}).data)
+
+        # The ETag covers the card columns too, so a friend's rename or new photo is not a 304
+        return conditional_response(request, build, [user.pk, *card_values(ids)])
 
 # ✅ Friend Request ViewSet
 class FriendRequestViewSet(viewsets.ModelViewSet):
@@ -431,9 +658,59 @@ class FriendRequestViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         user = self.request.user
-        return FriendRequest.objects.filter(
-            models.Q(sender=user) | models.Q(receiver=user)
-        )
+        params = self.request.query_params
+
+        # ✅ ?direction=sent|received and ?status= hit the (sender|receiver, status) indexes
+        direction = params.get('direction')
+        if direction == 'sent':
+            queryset = FriendRequest.objects.filter(sender=user)
+        elif direction == 'received':
+            queryset = FriendRequest.objects.filter(receiver=user)
+        else:
+            queryset = FriendRequest.objects.filter(
+                models.Q(sender=user) | models.Q(receiver=user)
+            )
+
+        request_status = params.get('status')
+        if request_status in dict(FriendRequest.STATUS_CHOICES):
+            queryset = queryset.filter(status=request_status)
+
+        return queryset.select_related('sender', 'receiver').only(
+            'id', 'status', 'created_at',
+            *(f'{side}__{field}' for side in ('sender', 'receiver') for field in ('id', 'first_name', 'last_name', 'email')),
+        ).order_by('-created_at', '-id')
+
+    # ✅ Bulk operations: {"ids": [...]} (or {"user_ids": [...]} to send), one transaction each
+    def _id_list(self, key):
+        ids = self.request.data.get(key)
+        if (
+            not isinstance(ids, list) or not ids or len(ids) > friend_requests.MAX_BATCH
+            or not all(isinstance(i, int) and not isinstance(i, bool) for i in ids)
+        ):
+            raise ValidationError({key: f"Expected a list of 1 to {friend_requests.MAX_BATCH} ids."})
+        return ids
+
+    @action(detail=False, methods=['POST'])
+    def bulk_accept(self, request):
+        return Response(friend_requests.accept_requests(request.user, self._id_list('ids')))
+
+    @action(detail=False, methods=['POST'])
+    def bulk_decline(self, request):
+        return Response(friend_requests.decline_requests(request.user, self._id_list('ids')))
+
+    @action(detail=False, methods=['POST'])
+    def bulk_delete(self, request):
+        return Response(friend_requests.delete_requests(request.user, self._id_list('ids')))
+
+    @action(detail=False, methods=['POST'])
+    def bulk_send(self, request):
+        report, wait = friend_requests.send_requests(request, self._id_list('user_ids'))
+        if wait is not None and not report['done']:
+            raise Throttled(wait)
+        response = Response(report, status=status.HTTP_201_CREATED if report['done'] else status.HTTP_200_OK)
+        if wait is not None:
+            response['Retry-After'] = str(wait)
+        return response
 
 
 # ✅ Friendship ViewSet
@@ -452,56 +729,49 @@ import json
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.contrib.auth import get_user_model
-from rest_framework_simplejwt.backends import TokenBackend
 from django.conf import settings
 from .models import Itinerary, ItineraryItem
+from .serializers import ItinerarySerializer
 
 User = get_user_model()
 
+def itinerary_error_messages(errors, label=""):
+    """Flatten ItinerarySerializer errors into lines like "Item 2, date: Enter a valid date."."""
+    if isinstance(errors, dict):
+        messages = []
+        for field, problems in errors.items():
+            name = "" if field == "non_field_errors" else field
+            messages += itinerary_error_messages(problems, ", ".join(filter(None, [label, name])))
+        return messages
+    if any(isinstance(problem, dict) for problem in errors):
+        # One entry per item, {} for the valid ones
+        return [
+            message
+            for number, problems in enumerate(errors, start=1)
+            for message in itinerary_error_messages(problems, f"Item {number}")
+        ]
+    return [f"{label}: {problem}" if label else str(problem) for problem in errors]
+
+
 @csrf_exempt
 def create_itinerary(request):
     if request.method == "POST":
         try:
-            # ✅ Use SimpleJWT's TokenBackend to validate token
-            auth_header = request.headers.get("Authorization", "")
-            parts = auth_header.split()
-
-            if len(parts) != 2 or parts[0].lower() != "bearer":
+            # ✅ Same cached JWT authentication the DRF views use
+            user = get_user_from_token(request)
+            if user is None:
                 return JsonResponse({"error": "Invalid or missing Authorization header"}, status=401)
 
-            token = parts[1]
-
-            # Use TokenBackend to decode
-            backend = TokenBackend(algorithm='HS256', signing_key=settings.SECRET_KEY)
-            payload = backend.decode(token, verify=True)
-            user_id = payload.get("user_id")
-
-            if not user_id:
-                return JsonResponse({"error": "User not found in token"}, status=401)
-
-            user = User.objects.get(id=user_id)
-
-            data = json.loads(request.body)
-            title = data.get("title")
-            items = data.get("items", [])
-
-            if not title:
-                return JsonResponse({"error": "Missing title"}, status=400)
-
-            itinerary = Itinerary.objects.create(user=user, title=title)
-
-            for item in items:
-                ItineraryItem.objects.create(
-                    itinerary=itinerary,
-                    date=item.get("date"),
-                    time=item.get("time") or None,
-                    location=item.get("location"),
-                    activity=item.get("activity", ""),
-                    notes=item.get("notes", "")
-                )
-
-            return JsonResponse({"message": "Itinerary created successfully"}, status=201)
+            # ✅ Validate every item first, then one transaction with a bulk insert
+            serializer = ItinerarySerializer(data=json.loads(request.body))
+            if not serializer.is_valid():
+                messages = itinerary_error_messages(serializer.errors)
+                return JsonResponse({"error": " ".join(messages), "messages": messages, "details": serializer.errors}, status=400)
+            serializer.save(user=user)
+            return JsonResponse(serializer.data, status=201)
 
+        except json.JSONDecodeError:
+            return JsonResponse({"error": "Invalid JSON body"}, status=400)
         except Exception as e:
             return JsonResponse({"error": str(e)}, status=500)
 
@@ -509,10 +779,13 @@ def create_itinerary(request):
 
 
 
-from rest_framework_simplejwt.backends import TokenBackend
 from django.conf import settings
 from django.http import JsonResponse
+from django.http import StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from . import itineraries as itineraries_listing
 from .models import Itinerary
 
 
@@ -528,32 +801,34 @@ def login_required_json(view_func):
 def get_user_itineraries(request):
     if request.method == "GET":
         try:
-            # ✅ Decode the access token
-            auth_header = request.headers.get("Authorization", "")
-            parts = auth_header.split()
-
-            if len(parts) != 2 or parts[0].lower() != "bearer":
+            # ✅ Same cached JWT authentication the DRF views use
+            user = get_user_from_token(request)
+            if user is None:
                 return JsonResponse({"error": "Invalid or missing Authorization header"}, status=401)
-
-            token = parts[1]
-            backend = TokenBackend(algorithm='HS256', signing_key=settings.SECRET_KEY)
-            payload = backend.decode(token, verify=True)
-            user_id = payload.get("user_id")
-
-            itineraries = Itinerary.objects.filter(user_id=user_id).order_by("-created_at")
-
-            data = []
-            for itinerary in itineraries:
-                items = itinerary.items.all().values("date", "time", "location", "activity", "notes")
-                data.append({
-                    "id": itinerary.id,
-                    "title": itinerary.title,
-                    "created_at": itinerary.created_at.strftime("%Y-%m-%d %H:%M"),
-                    "items": list(items)
+            user_id = user.pk
+
+            itineraries = Itinerary.objects.filter(user_id=user_id)
+            stamp = itineraries.aggregate(count=models.Count('id'), latest=models.Max('updated_at'))
+
+            # ✅ ?cursor= / ?page_size= for keyset pages; otherwise the whole
+            # history is streamed in chunks, each with one query for its items
+            paginator = itineraries_listing.ItineraryPagination()
+            drf_request = Request(request)
+
+            def build():
+                if not paginator.is_requested(drf_request):
+                    return StreamingHttpResponse(itineraries_listing.stream_itineraries(user_id), content_type="application/json")
+                page = paginator.paginate_queryset(itineraries_listing.user_itineraries(user_id), drf_request)
+                return JsonResponse({
+                    "next": paginator.get_next_link(),
+                    "previous": paginator.get_previous_link(),
+                    "results": itineraries_listing.itinerary_rows(page),
                 })
 
-            return JsonResponse(data, safe=False)
+            return conditional_response(request, build, [user_id, stamp['count'], stamp['latest']], stamp['latest'])
 
+        except NotFound as e:
+            return JsonResponse({"error": str(e.detail)}, status=404)
         except Exception as e:
             return JsonResponse({"error": str(e)}, status=500)
 
@@ -618,7 +893,10 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
+from django.db import transaction
+from django.utils.timezone import now
 from .models import Itinerary, ItineraryItem
+from .serializers import ItineraryItemSerializer, ItinerarySerializer
 
 @api_view(["PUT"])
 @permission_classes([IsAuthenticated])
@@ -628,38 +906,33 @@ def update_itinerary(request, id):
     except Itinerary.DoesNotExist:
         return Response({"error": "Itinerary not found."}, status=status.HTTP_404_NOT_FOUND)
 
-    data = request.data
-    title = data.get("title")
-    items = data.get("items")
-
-    if not title or not isinstance(items, list):
+    if not isinstance(request.data.get("items"), list):
         return Response({"error": "Invalid data provided."}, status=status.HTTP_400_BAD_REQUEST)
 
-    itinerary.title = title
-    itinerary.save()
-
-    # Remove old items
-    itinerary.items.all().delete()
-
-    # Add updated items
-    for item in items:
-        ItineraryItem.objects.create(
-            itinerary=itinerary,
-            date=item.get("date"),
-            time=item.get("time") or None,
-            location=item.get("location"),
-            activity=item.get("activity"),
-            notes=item.get("notes", "")
-        )
+    # ✅ Diff against the stored items instead of deleting and re-creating them all
+    serializer = ItinerarySerializer(itinerary, data=request.data)
+    if not serializer.is_valid():
+        return Response({"error": "Invalid data provided.", "details": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+    serializer.save()
+    return Response(serializer.data, status=status.HTTP_200_OK)
 
-    updated_data = {
-        "id": itinerary.id,
-        "title": itinerary.title,
-        "created_at": itinerary.created_at.strftime("%Y-%m-%d %H:%M"),
-        "items": items
-    }
 
-    return Response(updated_data, status=status.HTTP_200_OK)
+# ✅ Edit a single itinerary item
+@api_view(["PATCH"])
+@permission_classes([IsAuthenticated])
+def update_itinerary_item(request, id):
+    item = ItineraryItem.objects.filter(id=id, itinerary__user=request.user).first()
+    if item is None:
+        return Response({"error": "Itinerary item not found."}, status=status.HTTP_404_NOT_FOUND)
+
+    serializer = ItineraryItemSerializer(item, data=request.data, partial=True)
+    if not serializer.is_valid():
+        return Response({"error": "Invalid data provided.", "details": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+    with transaction.atomic():
+        serializer.save()
+        # Keeps the my-itineraries ETag honest
+        Itinerary.objects.filter(id=item.itinerary_id).update(updated_at=now())
+    return Response(serializer.data, status=status.HTTP_200_OK)
 
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
@@ -675,7 +948,7 @@ def accept_friend_request(request, request_id):
     friend_request = get_object_or_404(FriendRequest, id=request_id, receiver=request.user, status="pending")
     friend_request.status = "accepted"
     friend_request.save()
-    Friendship.objects.create(user1=friend_request.sender, user2=friend_request.receiver)
+    befriend(friend_request.sender_id, friend_request.receiver_id)
     return Response({"message": "Friend request accepted."}, status=status.HTTP_200_OK)
 
 
@@ -684,23 +957,9 @@ from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.contrib.auth import get_user_model
 from .models import FriendRequest
-import jwt
-from django.conf import settings
 
 User = get_user_model()
 
-def get_user_from_token(request):
-    auth = request.headers.get('Authorization')
-    if auth and auth.startswith('Bearer '):
-        token = auth.split(' ')[1]
-        try:
-            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
-            return User.objects.get(id=payload['user_id'])
-        except Exception as e:
-            print(f"Token decoding error: {e}")
-            return None
-    return None
-
 @csrf_exempt
 def delete_friend_request(request, request_id):
     if request.method == 'DELETE':
@@ -720,3 +979,16 @@ def delete_friend_request(request, request_id):
 
     return JsonResponse({'error': 'Invalid request method'}, status=405)
 
+
+
+from . import connect
+
+# ✅ Connect page bootstrap: friends, pending requests and suggestions in one round trip
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def connect_bootstrap(request):
+    try:
+        limit = max(0, min(int(request.query_params.get('suggestions', connect.SUGGESTION_LIMIT)), 50))
+    except ValueError:
+        limit = connect.SUGGESTION_LIMIT
+    return Response(connect.bootstrap(request, limit))
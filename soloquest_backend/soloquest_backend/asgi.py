@@ -12,5 +12,8 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "soloquest_backend.settings")
+# Serve signin/register/change-password from accounts.async_views, which
+# hash passwords in a process pool instead of on the event loop
+os.environ.setdefault("SOLOQUEST_ASYNC_AUTH_VIEWS", "1")
 
 application = get_asgi_application()
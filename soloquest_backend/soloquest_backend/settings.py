@@ -10,13 +10,14 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import os
 from pathlib import Path
 # settings.py
 from datetime import timedelta
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'accounts.authentication.CachedJWTAuthentication',
         'rest_framework.authentication.SessionAuthentication',
         'rest_framework.authentication.TokenAuthentication',
     ),
@@ -88,12 +89,13 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
+    # ✅ Path-aware: skipped for stateless JWT requests under /api/ (see accounts/middleware.py)
+    "accounts.middleware.PathAwareSessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",  # ✅ Must be before CommonMiddleware
     "django.middleware.common.CommonMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
+    "accounts.middleware.PathAwareCsrfViewMiddleware",
+    "accounts.middleware.PathAwareAuthenticationMiddleware",
+    "accounts.middleware.PathAwareMessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
@@ -188,3 +190,63 @@ AUTH_USER_MODEL = 'accounts.CustomUser'
 
 
 
+
+# Blog response cache (accounts.cache).  The in-process "lru" backend is only
+# coherent with a single worker process; point BACKEND at "django" with a
+# shared CACHES alias when running several.
+BLOG_CACHE = {
+    'BACKEND': 'lru',
+    'MAX_ENTRIES': 1024,
+}
+
+# Like counter write-behind (accounts.likes)
+LIKE_FLUSH_BATCH_SIZE = 100
+LIKE_FLUSH_INTERVAL = 1.0  # seconds; 0 writes every like straight through
+
+# Resized image variants (accounts.images); 0 builds them inline
+IMAGE_VARIANT_WORKERS = 2
+
+# Friends-first timelines (accounts.timeline): authors with more friends
+# than this are pulled at read time instead of fanned out on write
+TIMELINE_FANOUT_LIMIT = 500
+
+# Validated JWT -> user snapshot cache (accounts.authentication)
+JWT_USER_CACHE_SIZE = 10000
+JWT_USER_CACHE_TTL = 60  # seconds
+
+# Off-worker password hashing (accounts.hashing).  The async signin,
+# register and change-password views are routed in when running under ASGI.
+ASYNC_AUTH_VIEWS = os.environ.get("SOLOQUEST_ASYNC_AUTH_VIEWS") == "1"
+PASSWORD_HASHING_WORKERS = 2
+PASSWORD_HASHING_MAX_PENDING = 32
+
+# Stateless API fast path (accounts.middleware): requests under these
+# prefixes that carry a Bearer token or no session cookie skip session,
+# CSRF and messages processing
+STATELESS_API_PREFIXES = ("/api/",)
+STATEFUL_API_PATHS = ("/api/get-csrf-token/",)
+
+# Request rate limits (accounts.ratelimit).  The "local" backend counts per
+# worker process; use "cache" with a shared CACHES alias for several workers.
+RATE_LIMIT = {
+    "BACKEND": "local",
+    "RATES": {
+        "signin": "10/min",
+        "register": "5/hour",
+        "friend_request": "30/hour",
+        "like": "120/min",
+        "comment": "20/min",
+    },
+}
+
+# Per-user friend-ID sets (accounts.friends); same backends as BLOG_CACHE
+FRIEND_CACHE = {
+    "BACKEND": "lru",
+    "MAX_ENTRIES": 10000,
+}
+
+# Per-user bidirectional block sets (accounts.blocks)
+BLOCK_CACHE = {
+    "BACKEND": "lru",
+    "MAX_ENTRIES": 10000,
+}
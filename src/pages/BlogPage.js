@@ -30,8 +30,18 @@ const BlogPage = () => {
   }, []);
 
   const handleLike = async (postId) => {
+    const token = localStorage.getItem('access');
+    if (!token) {
+      alert('Please log in to like posts.');
+      return;
+    }
+
     try {
-      const response = await axios.post(`https://soloquest.onrender.com/posts/${postId}/like/`);
+      const response = await axios.post(
+        `https://soloquest.onrender.com/posts/${postId}/like/`,
+        {},
+        { headers: { Authorization: `Bearer ${token}` } }
+      );
       setBlogs((prevBlogs) =>
         prevBlogs.map((blog) =>
           blog.id === postId ? { ...blog, likes_count: response.data.likes_count } : blog
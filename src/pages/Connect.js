@@ -10,9 +10,11 @@ const getAuthHeaders = () => {
 
 const ConnectTravelers = () => {
   const [users, setUsers] = useState([]);
+  const [usersNext, setUsersNext] = useState(null);
   const [friends, setFriends] = useState([]);
   const [requestsSent, setRequestsSent] = useState([]);
   const [requestsReceived, setRequestsReceived] = useState([]);
+  const [suggestions, setSuggestions] = useState([]);
   const [loading, setLoading] = useState(true);
   const [activeTab, setActiveTab] = useState("users");
   const [searchTerm, setSearchTerm] = useState("");
@@ -24,49 +26,43 @@ const ConnectTravelers = () => {
     fetchAllData();
   }, []);
 
+  // ✅ Search on the server (prefix match, paginated) instead of downloading every user
+  useEffect(() => {
+    const timer = setTimeout(() => fetchUsers(searchTerm), 300);
+    return () => clearTimeout(timer);
+  }, [searchTerm]);
+
   const fetchAllData = async () => {
-    await Promise.all([
-      fetchUsers(),
-      fetchFriends(),
-      fetchRequests()
-    ]);
+    await fetchConnectData();
     setLoading(false);
   };
 
-  const fetchUsers = async () => {
+  const fetchUsers = async (term = "", pageUrl = null) => {
     try {
-      const response = await axios.get(`${API_BASE_URL}/api/users/`, {
+      const url = pageUrl || `${API_BASE_URL}/api/users/?page_size=50&q=${encodeURIComponent(term)}`;
+      const response = await axios.get(url, {
         headers: getAuthHeaders(),
       });
-      setUsers(response.data);
+      setUsers(prev => (pageUrl ? [...prev, ...response.data.results] : response.data.results));
+      setUsersNext(response.data.next);
     } catch (error) {
       console.error("❌ Error fetching users:", error.response?.data || error.message);
     }
   };
 
-  const fetchFriends = async () => {
-    try {
-      const response = await axios.get(`${API_BASE_URL}/api/users/my_friends/`, {
-        headers: getAuthHeaders(),
-      });
-      setFriends(response.data);
-    } catch (error) {
-      console.error("❌ Error fetching friends:", error.response?.data || error.message);
-    }
-  };
-
-  const fetchRequests = async () => {
+  // ✅ Friends, pending requests and suggestions in one call; user cards come once, keyed by id
+  const fetchConnectData = async () => {
     try {
-      const response = await axios.get(`${API_BASE_URL}/api/friend-requests/`, {
+      const response = await axios.get(`${API_BASE_URL}/api/connect/bootstrap/`, {
         headers: getAuthHeaders(),
       });
-      const userId = loggedInUser?.id;
-      const sent = response.data.filter(req => req.sender.id === userId && req.status === "pending");
-      const received = response.data.filter(req => req.receiver.id === userId && req.status === "pending");
-      setRequestsSent(sent);
-      setRequestsReceived(received);
+      const { users: cards, friends, requests_sent, requests_received, suggestions } = response.data;
+      setFriends(friends.map(id => cards[id]));
+      setRequestsSent(requests_sent.map(request => ({ ...request, receiver: cards[request.user] })));
+      setRequestsReceived(requests_received.map(request => ({ ...request, sender: cards[request.user] })));
+      setSuggestions(suggestions.map(suggestion => ({ ...cards[suggestion.user], mutual_friends: suggestion.mutual_friends })));
     } catch (error) {
-      console.error("❌ Error fetching friend requests:", error.response?.data || error.message);
+      console.error("❌ Error fetching connections:", error.response?.data || error.message);
     }
   };
 
@@ -77,7 +73,7 @@ const ConnectTravelers = () => {
       await axios.post(`${API_BASE_URL}/api/send-friend-request/${receiverId}/`, {}, {
         headers: getAuthHeaders(),
       });
-      fetchRequests();
+      fetchConnectData();
       setSuccessMessage("Request sent!");
       setTimeout(() => setSuccessMessage(""), 3000);
     } catch (error) {
@@ -90,8 +86,7 @@ const ConnectTravelers = () => {
       await axios.post(`${API_BASE_URL}/api/accept-friend-request/${requestId}/`, {}, {
         headers: getAuthHeaders(),
       });
-      fetchFriends();
-      fetchRequests();
+      fetchConnectData();
       setSuccessMessage("Friend request accepted!");
       setTimeout(() => setSuccessMessage(""), 3000);
     } catch (error) {
@@ -99,21 +94,34 @@ const ConnectTravelers = () => {
     }
   };
 
+  // ✅ One round trip for every pending request
+  const acceptAllFriendRequests = async () => {
+    try {
+      await axios.post(`${API_BASE_URL}/api/friend-requests/bulk_accept/`, {
+        ids: requestsReceived.map(request => request.id),
+      }, {
+        headers: getAuthHeaders(),
+      });
+      fetchConnectData();
+      setSuccessMessage("All friend requests accepted!");
+      setTimeout(() => setSuccessMessage(""), 3000);
+    } catch (error) {
+      console.error("❌ Error accepting friend requests:", error.response?.data || error.message);
+    }
+  };
+
   const deleteFriendRequest = async (requestId) => {
     try {
       await axios.delete(`${API_BASE_URL}/api/delete-friend-request/${requestId}/`, {
         headers: getAuthHeaders(),
       });
-      fetchRequests();
+      fetchConnectData();
     } catch (error) {
       console.error("❌ Error deleting friend request:", error.response?.data || error.message);
     }
   };
 
-  const filteredUsers = users.filter(user =>
-    user.id !== loggedInUser?.id &&
-    `${user.first_name} ${user.last_name} ${user.email}`.toLowerCase().includes(searchTerm.toLowerCase())
-  );
+  const filteredUsers = users.filter(user => user.id !== loggedInUser?.id);
 
   if (loading) return <p>Loading travelers...</p>;
 
@@ -139,6 +147,18 @@ const ConnectTravelers = () => {
             onChange={(e) => setSearchTerm(e.target.value)}
             style={styles.searchInput}
           />
+          {!searchTerm && suggestions.length > 0 && (
+            <ul style={styles.list}>
+              {suggestions.map(user => (
+                <li key={user.id} style={styles.userCard}>
+                  {user.first_name} {user.last_name} ({user.mutual_friends} mutual friends)
+                  <div>
+                    <button onClick={() => sendFriendRequest(user.id)} style={styles.button}>Add Friend</button>
+                  </div>
+                </li>
+              ))}
+            </ul>
+          )}
           <ul style={styles.list}>
             {filteredUsers.map(user => (
               <li key={user.id} style={styles.userCard}>
@@ -149,6 +169,9 @@ const ConnectTravelers = () => {
               </li>
             ))}
           </ul>
+          {usersNext && (
+            <button onClick={() => fetchUsers(searchTerm, usersNext)} style={styles.button}>Load more</button>
+          )}
         </>
       )}
 
@@ -168,6 +191,9 @@ const ConnectTravelers = () => {
 
       {activeTab === "requests-received" && (
         <ul style={styles.list}>
+          {requestsReceived.length > 1 && (
+            <button onClick={acceptAllFriendRequests} style={styles.button}>Accept all</button>
+          )}
           {requestsReceived.map(request => (
             <li key={request.id} style={styles.userCard}>
               {request.sender.first_name} {request.sender.last_name} ({request.sender.email})
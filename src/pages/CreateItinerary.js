@@ -43,7 +43,8 @@ const CreateItineraryPage = () => {
 
             if (!response.ok) {
                 const data = await response.json();
-                throw new Error(data.error || "Failed to create itinerary.");
+                // ✅ One line per invalid field, e.g. "Item 2, date: ..."
+                throw new Error((data.messages || []).join("\n") || data.error || "Failed to create itinerary.");
             }
 
             alert("✅ Itinerary created!");
@@ -128,7 +129,7 @@ const CreateItineraryPage = () => {
                     {loading ? "Saving..." : "Create Itinerary"}
                 </button>
 
-                {error && <p style={{ color: "red", marginTop: "10px" }}>{error}</p>}
+                {error && <p style={{ color: "red", marginTop: "10px", whiteSpace: "pre-line" }}>{error}</p>}
             </form>
         </div>
     );
@@ -76,29 +76,57 @@ const MyItinerariesPage = () => {
     setEditedItinerary({ ...editedItinerary, items: updatedItems });
   };
 
+  const authHeaders = () => ({
+    "Content-Type": "application/json",
+    Authorization: `Bearer ${localStorage.getItem("access")}`,
+  });
+
+  // ✅ Send only what changed: one PATCH per edited item, or a single diffing PUT
+  // when the title changed too
   const handleEditSubmit = async () => {
-    try {
-      const response = await fetch(`https://soloquest.onrender.com/api/update-itinerary/${editingItinerary.id}/`, {
-        method: "PUT",
-        headers: {
-          "Content-Type": "application/json",
-          Authorization: `Bearer ${localStorage.getItem("access")}`,
-        },
-        body: JSON.stringify({
-          title: editedItinerary.title,
-          timezone: editedItinerary.timezone,
-          items: editedItinerary.items,
-        }),
-      });
+    const original = Object.fromEntries(editingItinerary.items.map((item) => [item.id, item]));
+    const fields = ["date", "time", "location", "activity", "notes"];
+    const changedItems = editedItinerary.items.filter((item) =>
+      fields.some((field) => (original[item.id]?.[field] ?? "") !== (item[field] ?? ""))
+    );
 
-      if (response.ok) {
-        const updated = await response.json();
-        setItineraries((prev) => prev.map((item) => item.id === updated.id ? updated : item));
-        setEditingItinerary(null);
+    try {
+      let updated;
+      if (editedItinerary.title !== editingItinerary.title) {
+        const response = await fetch(`https://soloquest.onrender.com/api/update-itinerary/${editingItinerary.id}/`, {
+          method: "PUT",
+          headers: authHeaders(),
+          body: JSON.stringify({
+            title: editedItinerary.title,
+            timezone: editedItinerary.timezone,
+            items: editedItinerary.items,
+          }),
+        });
+        if (!response.ok) {
+          const errorData = await response.json();
+          alert(errorData.error || "Failed to update itinerary.");
+          return;
+        }
+        updated = await response.json();
       } else {
-        const errorData = await response.json();
-        alert(errorData.error || "Failed to update itinerary.");
+        const responses = await Promise.all(changedItems.map((item) =>
+          fetch(`https://soloquest.onrender.com/api/itinerary-items/${item.id}/`, {
+            method: "PATCH",
+            headers: authHeaders(),
+            body: JSON.stringify(Object.fromEntries(fields.map((field) => [field, item[field]]))),
+          })
+        ));
+        const failed = responses.find((response) => !response.ok);
+        if (failed) {
+          const errorData = await failed.json();
+          alert(errorData.error || "Failed to update itinerary.");
+          return;
+        }
+        const saved = Object.fromEntries((await Promise.all(responses.map((response) => response.json()))).map((item) => [item.id, item]));
+        updated = { ...editingItinerary, items: editingItinerary.items.map((item) => saved[item.id] || item) };
       }
+      setItineraries((prev) => prev.map((item) => item.id === updated.id ? { ...item, ...updated } : item));
+      setEditingItinerary(null);
     } catch (err) {
       console.error("Edit error:", err);
       alert("Something went wrong while updating.");
@@ -131,7 +159,7 @@ const MyItinerariesPage = () => {
               {itinerary.items.map((item, index) => {
                 const { userTime, destTime } = formatTime(item.date, item.time, itinerary.timezone);
                 return (
-                  <li key={index}>
+                  <li key={item.id}>
                     <strong>{item.date}</strong> {item.time && `@ ${item.time}`}<br />
                     {item.location} — {item.activity}<br />
                     <small><em>Your Time: {userTime}</em></small><br />
@@ -169,7 +197,7 @@ const MyItinerariesPage = () => {
               ))}
             </select>
             {editedItinerary.items.map((item, index) => (
-              <div key={index} style={{ marginBottom: '15px' }}>
+              <div key={item.id} style={{ marginBottom: '15px' }}>
                 <input
                   type="date"
                   value={item.date || ''}